@@ -4,3 +4,15 @@ from django.apps import AppConfig
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
+
+    def ready(self):
+        # Register signal handlers
+        from . import signals  # noqa: F401
+
+        # Create the upload directory once here instead of on every upload request.
+        # Not fatal: commands like migrate run where MEDIA_ROOT may not be writable.
+        from django.conf import settings
+        try:
+            (settings.MEDIA_ROOT / 'mcap_logs').mkdir(parents=True, exist_ok=True)
+        except OSError:
+            pass
@@ -0,0 +1,38 @@
+"""
+Live MCAP log status updates over Redis pub/sub.
+
+Celery tasks publish a message whenever a log's recovery/parse status changes;
+the web tier relays them to browsers as Server-Sent Events (see views.status_events).
+"""
+import json
+import logging
+
+import redis
+from django.conf import settings
+
+
+logger = logging.getLogger(__name__)
+
+# Redis pub/sub channel carrying {"log_id": ..., "<field>": ...} JSON messages
+STATUS_CHANNEL = 'mcap:status'
+
+_client = None
+
+
+def get_redis():
+    """Return a process-wide Redis client for status events."""
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(settings.STATUS_EVENTS_REDIS_URL)
+    return _client
+
+
+def publish_status(mcap_log_id, **fields):
+    """
+    Publish a status change for an MCAP log.
+    Failures are logged and swallowed so they never fail the calling task.
+    """
+    try:
+        get_redis().publish(STATUS_CHANNEL, json.dumps({'log_id': mcap_log_id, **fields}))
+    except redis.RedisError:
+        logger.warning("Could not publish status for log %s", mcap_log_id, exc_info=True)
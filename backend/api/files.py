@@ -0,0 +1,102 @@
+"""
+File helpers shared by the views and the Celery tasks: mapping stored media
+URIs to paths, naming converted files, and adding files to ZIP archives.
+"""
+import os
+import shutil
+import time
+import zipfile
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+
+
+# Buffer size used when copying a file into a ZIP archive
+ZIP_COPY_BUFFER_SIZE = 1024 * 1024
+
+
+@lru_cache(maxsize=1)
+def _media_root_real(media_root):
+    """MEDIA_ROOT with symlinks resolved, computed once per MEDIA_ROOT value."""
+    return Path(media_root).resolve()
+
+
+def media_path(uri):
+    """
+    Filesystem path for a stored media URI (MEDIA_URL-prefixed, absolute, or
+    relative), or None if it points outside MEDIA_ROOT. original_uri can be
+    set by API clients, so '..' segments, symlinks and absolute paths must not
+    reach files elsewhere on the server.
+    """
+    media_root = _media_root_real(settings.MEDIA_ROOT)
+    if uri.startswith(settings.MEDIA_URL):
+        uri = uri.replace(settings.MEDIA_URL, '', 1)
+    # An absolute uri replaces media_root in the join
+    path = (media_root / uri).resolve()
+    if not path.is_relative_to(media_root):
+        return None
+    return path
+
+
+def original_file_path(mcap_log):
+    """
+    Filesystem path of a log's original MCAP file, or None if it has no URI
+    or the URI points outside MEDIA_ROOT. Whether the file exists is left to
+    whoever opens it.
+    """
+    if not mcap_log.original_uri:
+        return None
+    return media_path(mcap_log.original_uri)
+
+
+def recovered_file_path(mcap_log):
+    """
+    Filesystem path of a log's recovered MCAP file, or None if recovery hasn't
+    produced one on disk or its URI points outside MEDIA_ROOT.
+    """
+    if not mcap_log.recovered_uri or mcap_log.recovered_uri == "pending":
+        return None
+    recovered_path = media_path(mcap_log.recovered_uri)
+    if recovered_path and recovered_path.is_file():
+        return recovered_path
+    return None
+
+
+def conversion_source_path(mcap_log):
+    """
+    File to convert for a log: the recovered MCAP if there is one on disk,
+    otherwise the original (which may not exist). None if neither URI maps to
+    a path inside MEDIA_ROOT.
+    """
+    return recovered_file_path(mcap_log) or original_file_path(mcap_log)
+
+
+def conversion_output(format):
+    """(format profile, file extension) for a download format such as 'csv_omni' or 'ld'."""
+    format_suffix = format.replace('csv_', '') if format.startswith('csv_') else format
+    file_extension = 'ld' if format_suffix == 'ld' else 'csv'
+    return format_suffix, file_extension
+
+
+def converted_arcname(file_name, format):
+    """Name of a log's converted file inside a download ZIP."""
+    format_suffix, file_extension = conversion_output(format)
+    return f"{Path(file_name).stem}_{format_suffix}.{file_extension}"
+
+
+def write_to_zip(zip_file, file_path, arcname):
+    """
+    Copy a file into an open ZipFile with one open() and one fstat(), instead
+    of resolving/stat'ing the path first. Raises FileNotFoundError or
+    IsADirectoryError like open() does.
+    """
+    with open(file_path, 'rb') as source:
+        stat_result = os.fstat(source.fileno())
+        zip_info = zipfile.ZipInfo(arcname, date_time=time.localtime(stat_result.st_mtime)[:6])
+        # A hand-built ZipInfo doesn't inherit the archive's settings
+        zip_info.compress_type = zip_file.compression
+        zip_info.compress_level = zip_file.compresslevel
+        zip_info.file_size = stat_result.st_size
+        with zip_file.open(zip_info, 'w') as destination:
+            shutil.copyfileobj(source, destination, length=ZIP_COPY_BUFFER_SIZE)
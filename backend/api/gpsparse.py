@@ -1,3 +1,8 @@
+import struct
+import sys
+import traceback
+from array import array
+from itertools import chain
 from mcap_protobuf.decoder import DecoderFactory
 from mcap.reader import make_reader
 
@@ -85,7 +90,6 @@ class GpsParser:
                     except Exception as e:
                         if message_count == 1:
                             print(f"Debug: Error extracting GPS values: {e}")
-                            import traceback
                             traceback.print_exc()
                 
                 if message_count == 0:
@@ -98,7 +102,6 @@ class GpsParser:
         except Exception as e:
             # If topic doesn't exist or parsing fails, return None values
             print(f"Debug: Error parsing GPS: {str(e)}")
-            import traceback
             traceback.print_exc()
         
         print(f"Debug: GPS parse result - First coordinate: ({latitude}, {longitude}), Total coordinates: {len(all_coordinates)}")
@@ -108,3 +111,18 @@ class GpsParser:
             "all_coordinates": all_coordinates
         }
 
+    @staticmethod
+    def linestring_wkb(coordinates):
+        """
+        Encode [longitude, latitude] pairs as a WKB LineString, packed straight
+        from the coordinate list without building a GEOS geometry.
+        
+        Args:
+            coordinates: List of [longitude, latitude] pairs (at least two)
+            
+        Returns:
+            WKB bytes in native byte order
+        """
+        # Header: byte order flag, geometry type (2 = LineString), point count
+        header = struct.pack('=BII', 1 if sys.byteorder == 'little' else 0, 2, len(coordinates))
+        return header + array('d', chain.from_iterable(coordinates)).tobytes()
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-15 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_mcaplog_parse_task_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mcaplog',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
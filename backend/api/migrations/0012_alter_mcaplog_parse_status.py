@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-15 10:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_mcaplog_updated_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='mcaplog',
+            name='parse_status',
+            field=models.CharField(db_index=True, default='pending'),
+        ),
+    ]
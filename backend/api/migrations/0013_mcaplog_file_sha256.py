@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-15 11:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_alter_mcaplog_parse_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mcaplog',
+            name='file_sha256',
+            field=models.CharField(blank=True, help_text='SHA-256 of the uploaded file', max_length=64, null=True),
+        ),
+    ]
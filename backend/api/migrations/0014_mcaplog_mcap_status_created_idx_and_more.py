@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-15 11:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_mcaplog_file_sha256'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='mcaplog',
+            index=models.Index(fields=['parse_status', '-created_at'], name='mcap_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mcaplog',
+            index=models.Index(fields=['-created_at'], name='mcaplog_created_idx'),
+        ),
+    ]
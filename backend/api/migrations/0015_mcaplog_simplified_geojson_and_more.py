@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-15 23:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_mcaplog_mcap_status_created_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mcaplog',
+            name='simplified_geojson',
+            field=models.TextField(blank=True, help_text='Cached GeoJSON of lap_path simplified at simplified_tolerance', null=True),
+        ),
+        migrations.AddField(
+            model_name='mcaplog',
+            name='simplified_tolerance',
+            field=models.FloatField(blank=True, help_text='ST_SimplifyVW tolerance simplified_geojson was built with', null=True),
+        ),
+    ]
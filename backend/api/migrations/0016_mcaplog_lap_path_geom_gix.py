@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-15 23:20
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_mcaplog_simplified_geojson_and_more'),
+    ]
+
+    operations = [
+        # Expression index for the location filter, which compares lap_path as
+        # geometry (the geography index on lap_path can't serve that)
+        migrations.RunSQL(
+            sql='CREATE INDEX mcaplog_lap_path_geom_gix ON api_mcaplog USING GIST ((lap_path::geometry));',
+            reverse_sql='DROP INDEX IF EXISTS mcaplog_lap_path_geom_gix;',
+        ),
+    ]
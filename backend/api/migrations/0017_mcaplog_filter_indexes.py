@@ -0,0 +1,34 @@
+# Generated by Django 5.2.7 on 2026-10-15 23:35
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_mcaplog_lap_path_geom_gix'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='mcaplog',
+            index=models.Index(fields=['recovery_status'], name='mcaplog_recovery_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mcaplog',
+            index=models.Index(fields=['captured_at'], name='mcaplog_captured_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mcaplog',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.functions.comparison.Cast('file_name', models.TextField())), name='gin_trgm_ops'), name='mcaplog_file_name_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='mcaplog',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.functions.comparison.Cast('notes', models.TextField())), name='gin_trgm_ops'), name='mcaplog_notes_trgm'),
+        ),
+    ]
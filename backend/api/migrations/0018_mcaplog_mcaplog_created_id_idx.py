@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-15 23:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0017_mcaplog_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='mcaplog',
+            index=models.Index(fields=['-created_at', '-id'], name='mcaplog_created_id_idx'),
+        ),
+    ]
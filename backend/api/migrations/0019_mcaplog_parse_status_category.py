@@ -0,0 +1,22 @@
+# Generated by Django 5.2.7 on 2026-10-15 23:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0018_mcaplog_mcaplog_created_id_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mcaplog',
+            name='parse_status_category',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(parse_status__startswith='error', then=models.Value('error')), default=models.F('parse_status')), output_field=models.CharField()),
+        ),
+        migrations.AddIndex(
+            model_name='mcaplog',
+            index=models.Index(fields=['parse_status_category', '-created_at'], name='mcaplog_category_created_idx'),
+        ),
+    ]
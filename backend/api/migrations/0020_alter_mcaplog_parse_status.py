@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-16 00:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0019_mcaplog_parse_status_category'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='mcaplog',
+            name='parse_status',
+            field=models.CharField(default='pending'),
+        ),
+    ]
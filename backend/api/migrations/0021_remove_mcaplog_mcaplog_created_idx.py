@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-16 00:06
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0020_alter_mcaplog_parse_status'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='mcaplog',
+            name='mcaplog_created_idx',
+        ),
+    ]
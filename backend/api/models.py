@@ -1,5 +1,6 @@
 from django.contrib.gis.db import models
-from django.contrib.gis.geos import LineString
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db.models.functions import Cast, Upper
 
 
 class Car(models.Model):
@@ -23,10 +24,21 @@ class EventType(models.Model):
 class McapLog(models.Model):
     file_name = models.CharField(max_length=200)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     original_uri = models.TextField(null=True, blank=True)
     recovered_uri = models.CharField(default="pending")
     recovery_status = models.CharField(default="pending")
     parse_status = models.CharField(default="pending")
+    # parse_status with every "error: ..." message collapsed to "error", so the
+    # job-statuses error filter is an equality lookup on an index
+    parse_status_category = models.GeneratedField(
+        expression=models.Case(
+            models.When(parse_status__startswith='error', then=models.Value('error')),
+            default=models.F('parse_status'),
+        ),
+        output_field=models.CharField(),
+        db_persist=True,
+    )
     parse_task_id = models.CharField(max_length=255, null=True, blank=True, help_text="Celery task ID for parsing job")
     captured_at = models.DateTimeField(null=True)
     start_time = models.FloatField(null=True, help_text="Unix timestamp in seconds")
@@ -35,9 +47,34 @@ class McapLog(models.Model):
     channel_count = models.IntegerField(default=0)
     channels = models.JSONField(default=list, blank=True, help_text="List of channel names")
     file_size = models.BigIntegerField(null=True, blank=True, help_text="File size in bytes")
+    file_sha256 = models.CharField(max_length=64, null=True, blank=True, help_text="SHA-256 of the uploaded file")
     lap_path = models.LineStringField(geography=True, srid=4326, null=True, blank=True, help_text="GPS path as LineString for map preview")
+    simplified_geojson = models.TextField(null=True, blank=True, help_text="Cached GeoJSON of lap_path simplified at simplified_tolerance")
+    simplified_tolerance = models.FloatField(null=True, blank=True, help_text="ST_SimplifyVW tolerance simplified_geojson was built with")
     notes = models.TextField(blank=True, null=True)
 
     car = models.ForeignKey(Car, null=True, blank=True, on_delete=models.SET_NULL)
     driver = models.ForeignKey(Driver, null=True, blank=True, on_delete=models.SET_NULL)
     event_type = models.ForeignKey(EventType, null=True, blank=True, on_delete=models.SET_NULL)
+
+    class Meta:
+        indexes = [
+            # job-statuses: filter by status, newest first
+            models.Index(fields=['parse_status', '-created_at'], name='mcap_status_created_idx'),
+            models.Index(fields=['parse_status_category', '-created_at'], name='mcaplog_category_created_idx'),
+            # Newest-first listings and the cursor-paginated list's seek on (created_at, id)
+            models.Index(fields=['-created_at', '-id'], name='mcaplog_created_id_idx'),
+            # List filters (FK columns are already indexed by their ForeignKey)
+            models.Index(fields=['recovery_status'], name='mcaplog_recovery_status_idx'),
+            models.Index(fields=['captured_at'], name='mcaplog_captured_at_idx'),
+            # ?search substring matching: icontains compiles to
+            # UPPER(col::text) LIKE UPPER('%...%'), which these trigram indexes serve
+            GinIndex(
+                OpClass(Upper(Cast('file_name', models.TextField())), name='gin_trgm_ops'),
+                name='mcaplog_file_name_trgm',
+            ),
+            GinIndex(
+                OpClass(Upper(Cast('notes', models.TextField())), name='gin_trgm_ops'),
+                name='mcaplog_notes_trgm',
+            ),
+        ]
@@ -0,0 +1,54 @@
+"""
+Pagination classes for the api app.
+"""
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+
+
+class BoundedPageNumberPagination(PageNumberPagination):
+    """
+    Default pagination: PAGE_SIZE rows per page, or ?page_size=N up to
+    max_page_size, so no request can pull an unbounded result set.
+    """
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+
+
+class McapLogCursorPagination(CursorPagination):
+    """
+    Opt-in cursor pagination for the McapLog list (?pagination=cursor).
+    Each page is an index range scan on (-created_at, -id) with a LIMIT, so
+    deep pages don't pay for a growing OFFSET. There are no page numbers or
+    count; follow the 'next'/'previous' links.
+    """
+    ordering = ('-created_at', '-id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+
+
+class JobStatusPagination(CursorPagination):
+    """
+    Cursor pagination for job-statuses, newest first.
+    Cursors seek on (created_at, id), backed by the (-created_at, -id) index
+    (status-filtered pages by (parse_status, -created_at)), so deep pages cost
+    the same as the first one and logs with equal timestamps are neither
+    repeated nor skipped. Like any cursor pagination there is no total count;
+    'page_count' is the number of results on this page.
+    """
+    ordering = ('-created_at', '-id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+
+    def get_paginated_data(self, data):
+        """Paginated envelope as a plain dict, for views that render it themselves."""
+        return {
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'page_count': len(data),
+            'results': data,
+        }
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
@@ -17,13 +17,9 @@ class Parser:
             summary = reader.get_summary()
             available_channels = summary.channels
             
-            # Get channels list
-            channels = []
-            for value in available_channels.values():
-                dict_to_val = str(value)
-                split_channel = dict_to_val.split("topic='")[1]
-                topic = split_channel.split("'")[0]
-                channels.append(topic)
+            # Get channels list (read the topic off each Channel record instead of
+            # formatting the whole record to a string and splitting it back out)
+            channels = [channel.topic for channel in available_channels.values()]
 
             # Get timestamps and duration
             msg_start = (summary.statistics.message_start_time)/(1e9)
@@ -0,0 +1,23 @@
+"""
+drf-yasg schema generation helpers.
+"""
+from drf_yasg.generators import OpenAPISchemaGenerator
+
+
+class CachedSchemaGenerator(OpenAPISchemaGenerator):
+    """
+    Schema generator that introspects the API once per process and reuses the result.
+    The view/serializer layout only changes on deploy (or a runserver reload, which
+    restarts the process), so walking every view on each /swagger/ hit is wasted work.
+    Schemas are cached per scheme+host because the spec embeds them.
+    """
+    _schema_cache = {}
+
+    def get_schema(self, request=None, public=False):
+        base_url = self.url or (request.build_absolute_uri('/') if request is not None else None)
+        cache_key = (self.version, public, base_url)
+        schema = self._schema_cache.get(cache_key)
+        if schema is None:
+            schema = super().get_schema(request, public)
+            self._schema_cache[cache_key] = schema
+        return schema
@@ -53,6 +53,7 @@ class McapLogSerializer(serializers.ModelSerializer):
         fields = ['id',
                   'file_name',
                   'created_at',
+                  'updated_at',
                   'original_uri',
                   'recovered_uri',
                   'recovery_status',
@@ -65,6 +66,7 @@ class McapLogSerializer(serializers.ModelSerializer):
                   'channel_count',
                   'channels',
                   'file_size',
+                  'file_sha256',
                   'lap_path',
                   'car',
                   'driver',
@@ -75,7 +77,82 @@ class McapLogSerializer(serializers.ModelSerializer):
                   'notes',
                   'file'
                   ]
+        read_only_fields = ['file_sha256']
         
+def _related_from_row(row, prefix):
+    """Build the nested {id, name} object for a FK from a values() row."""
+    related_id = row.get(f'{prefix}_id')
+    if related_id is None:
+        return None
+    return {'id': related_id, 'name': row.get(f'{prefix}__name')}
+
+
+class McapLogListSerializer(serializers.Serializer):
+    """
+    Read-only serializer for the list endpoint.
+    Works on dict rows from McapLog.objects.values(*McapLogListSerializer.values_fields)
+    instead of model instances, and leaves out the (large) lap_path geography.
+    Output matches McapLogSerializer minus lap_path.
+    """
+    values_fields = (
+        'id',
+        'file_name',
+        'created_at',
+        'updated_at',
+        'original_uri',
+        'recovered_uri',
+        'recovery_status',
+        'parse_status',
+        'parse_task_id',
+        'captured_at',
+        'start_time',
+        'end_time',
+        'duration_seconds',
+        'channel_count',
+        'channels',
+        'file_size',
+        'file_sha256',
+        'notes',
+        'car_id',
+        'car__name',
+        'driver_id',
+        'driver__name',
+        'event_type_id',
+        'event_type__name',
+    )
+
+    id = serializers.IntegerField(read_only=True)
+    file_name = serializers.CharField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+    updated_at = serializers.DateTimeField(read_only=True)
+    original_uri = serializers.CharField(read_only=True, allow_null=True)
+    recovered_uri = serializers.CharField(read_only=True)
+    recovery_status = serializers.CharField(read_only=True)
+    parse_status = serializers.CharField(read_only=True)
+    parse_task_id = serializers.CharField(read_only=True, allow_null=True)
+    captured_at = serializers.DateTimeField(read_only=True, allow_null=True)
+    start_time = serializers.FloatField(read_only=True, allow_null=True)
+    end_time = serializers.FloatField(read_only=True, allow_null=True)
+    duration_seconds = serializers.FloatField(read_only=True, allow_null=True)
+    channel_count = serializers.IntegerField(read_only=True)
+    channels = serializers.JSONField(read_only=True)
+    file_size = serializers.IntegerField(read_only=True, allow_null=True)
+    file_sha256 = serializers.CharField(read_only=True, allow_null=True)
+    car = serializers.SerializerMethodField()
+    driver = serializers.SerializerMethodField()
+    event_type = serializers.SerializerMethodField()
+    notes = serializers.CharField(read_only=True, allow_null=True)
+
+    def get_car(self, row):
+        return _related_from_row(row, 'car')
+
+    def get_driver(self, row):
+        return _related_from_row(row, 'driver')
+
+    def get_event_type(self, row):
+        return _related_from_row(row, 'event_type')
+
+
 class ParseSummaryRequestSerializer(serializers.Serializer):
     path = serializers.CharField()
     
@@ -92,4 +169,9 @@ class DownloadRequestSerializer(serializers.Serializer):
         required=False,
         help_text="Output format: 'mcap' for original files, 'csv_omni', 'csv_tvn', or 'ld' for conversion"
     )
+    background = serializers.BooleanField(
+        default=False,
+        required=False,
+        help_text="Build the ZIP in a background task: respond 202 with a result_url to fetch it from"
+    )
 
@@ -0,0 +1,50 @@
+"""
+Signal handlers for the api app.
+"""
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Car, Driver, EventType, McapLog
+
+
+# Models backing the dropdown list endpoints, whose responses are cached
+LOOKUP_MODELS = (Car, Driver, EventType)
+
+# Counter bumped on every McapLog write; cached job-statuses responses are keyed on it
+MCAP_LOG_VERSION_KEY = "mcaplog:version"
+
+
+def list_cache_key(model):
+    """Cache key for the cached (etag, data) list response of a lookup model."""
+    return f"{model._meta.model_name}:list:etag"
+
+
+@receiver([post_save, post_delete])
+def invalidate_lookup_list_cache(sender, **kwargs):
+    """Drop the cached dropdown list when a Car, Driver or EventType changes."""
+    if sender in LOOKUP_MODELS:
+        cache.delete(list_cache_key(sender))
+
+
+def mcap_log_version():
+    """Current McapLog version (0 until the first write after a cache flush)."""
+    return cache.get(MCAP_LOG_VERSION_KEY, 0)
+
+
+def bump_mcap_log_version():
+    """
+    Mark McapLog as changed. Call after writes that bypass model signals
+    (queryset update() and bulk_create()).
+    """
+    try:
+        cache.incr(MCAP_LOG_VERSION_KEY)
+    except ValueError:
+        # Not set yet (or evicted)
+        cache.set(MCAP_LOG_VERSION_KEY, 1, timeout=None)
+
+
+@receiver([post_save, post_delete], sender=McapLog)
+def invalidate_mcap_log_version(sender, **kwargs):
+    """Bump the McapLog version when a log is saved or deleted."""
+    bump_mcap_log_version()
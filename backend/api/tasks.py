@@ -2,19 +2,51 @@
 Background tasks for MCAP log processing.
 """
 from celery import shared_task
+from celery.utils import uuid
 from django.contrib.gis.geos import LineString
 from django.utils import timezone
 from django.conf import settings
+from django.core.cache import cache
 from pathlib import Path
 import datetime
 import subprocess
 import shutil
+import tempfile
+import zipfile
+from mcap.exceptions import McapError
+from .events import publish_status
+from .files import (
+    conversion_output,
+    conversion_source_path,
+    converted_arcname,
+    media_path,
+    original_file_path,
+    recovered_file_path,
+    write_to_zip,
+)
 from .models import McapLog
+from .signals import bump_mcap_log_version
 from .parser import Parser
 from .gpsparse import GpsParser
 from .mcap_converter import McapToCsvConverter
 
 
+# Seconds a parsed MCAP summary stays cached (keys change when the file does)
+PARSE_SUMMARY_CACHE_TTL = 60 * 60
+
+
+def _update_log(mcap_log_id, **fields):
+    """
+    Write status fields for one McapLog as a single bare UPDATE (no model
+    save, signals or re-read). updated_at is set explicitly since auto_now
+    only applies on save(). Bumps the McapLog cache version, since update()
+    sends no signals. Returns the number of rows updated (0 if the log is gone).
+    """
+    updated = McapLog.objects.filter(pk=mcap_log_id).update(updated_at=timezone.now(), **fields)
+    bump_mcap_log_version()
+    return updated
+
+
 @shared_task(bind=True, max_retries=3)
 def recover_mcap_file(self, mcap_log_id, file_path):
     """
@@ -25,7 +57,10 @@ def recover_mcap_file(self, mcap_log_id, file_path):
         file_path: Relative path (preferred) or absolute path to the MCAP file to recover
     """
     try:
-        mcap_log = McapLog.objects.get(id=mcap_log_id)
+        # Update recovery status to processing; no row updated means the log was deleted
+        if not _update_log(mcap_log_id, recovery_status="processing"):
+            raise McapLog.DoesNotExist
+        publish_status(mcap_log_id, recovery_status="processing")
 
         # Resolve relative paths against MEDIA_ROOT to support Dockerized workers
         p = Path(file_path)
@@ -43,10 +78,6 @@ def recover_mcap_file(self, mcap_log_id, file_path):
         if not original_file_path.exists():
             raise FileNotFoundError(f"MCAP file not found: {original_file_path}")
         
-        # Update recovery status to processing
-        mcap_log.recovery_status = "processing"
-        mcap_log.save(update_fields=['recovery_status'])
-        
         # Find mcap command
         mcap_cmd = shutil.which('mcap')
         if not mcap_cmd:
@@ -89,17 +120,24 @@ def recover_mcap_file(self, mcap_log_id, file_path):
         if recovery_output:
             print(f"[recover_mcap_file] Recovery statistics: {recovery_output}")
         
-        # Store the recovered file URI (relative to MEDIA_ROOT)
+        # Store the recovered file URI (relative to MEDIA_ROOT) together with the
+        # ID of the parse task dispatched below, in one UPDATE, so job statuses
+        # follow the parse task from here on
         recovered_relpath = recovered_file_path.relative_to(settings.MEDIA_ROOT)
-        mcap_log.recovered_uri = f"{settings.MEDIA_URL}{recovered_relpath.as_posix()}"
-        mcap_log.recovery_status = "completed"
-        mcap_log.save(update_fields=['recovered_uri', 'recovery_status'])
+        parse_task_id = uuid()
+        _update_log(
+            mcap_log_id,
+            recovered_uri=f"{settings.MEDIA_URL}{recovered_relpath.as_posix()}",
+            recovery_status="completed",
+            parse_task_id=parse_task_id,
+        )
+        publish_status(mcap_log_id, recovery_status="completed")
         
         print(f"[recover_mcap_file] Successfully recovered MCAP file: {recovered_file_path}")
         
         # Trigger parsing after recovery completes
         # Use the original file_path (relative) - parse will use recovered file if available
-        parse_mcap_file.delay(mcap_log_id, file_path)
+        parse_mcap_file.apply_async(args=(mcap_log_id, file_path), task_id=parse_task_id)
         
         return mcap_log_id  # Return ID for potential chaining
         
@@ -107,18 +145,18 @@ def recover_mcap_file(self, mcap_log_id, file_path):
         return f"McapLog with id {mcap_log_id} does not exist"
     except subprocess.TimeoutExpired:
         try:
-            mcap_log = McapLog.objects.get(id=mcap_log_id)
-            mcap_log.recovery_status = "error: timeout after 5 minutes"
-            mcap_log.save(update_fields=['recovery_status'])
+            recovery_status = "error: timeout after 5 minutes"
+            _update_log(mcap_log_id, recovery_status=recovery_status)
+            publish_status(mcap_log_id, recovery_status=recovery_status)
         except:
             pass
         return f"Recovery timed out for log {mcap_log_id}"
     except Exception as e:
         # Update recovery status with error
         try:
-            mcap_log = McapLog.objects.get(id=mcap_log_id)
-            mcap_log.recovery_status = f"error: {str(e)}"
-            mcap_log.save(update_fields=['recovery_status'])
+            recovery_status = f"error: {str(e)}"
+            _update_log(mcap_log_id, recovery_status=recovery_status)
+            publish_status(mcap_log_id, recovery_status=recovery_status)
         except:
             pass
         
@@ -141,31 +179,18 @@ def parse_mcap_file(self, mcap_log_id, file_path):
     try:
         mcap_log = McapLog.objects.get(id=mcap_log_id)
 
-        # Resolve relative paths against MEDIA_ROOT to support Dockerized workers
-        p = Path(file_path)
-        if not p.is_absolute():
-            p = (Path(settings.MEDIA_ROOT) / p).resolve()
-        original_file_path = p
-
-        # Try to use recovered file if available, otherwise use original
-        file_to_parse = None
-        if mcap_log.recovered_uri and mcap_log.recovered_uri != "pending":
-            # Extract path from recovered_uri
-            if mcap_log.recovered_uri.startswith(settings.MEDIA_URL):
-                file_name = mcap_log.recovered_uri.replace(settings.MEDIA_URL, '', 1)
-                recovered_path = Path(settings.MEDIA_ROOT) / file_name
-            elif mcap_log.recovered_uri.startswith('/'):
-                recovered_path = Path(mcap_log.recovered_uri)
-            else:
-                recovered_path = Path(settings.MEDIA_ROOT) / mcap_log.recovered_uri
-            
-            if recovered_path.exists():
-                file_to_parse = str(recovered_path)
-                print(f"[parse_mcap_file] Using recovered file: {file_to_parse}")
-        
-        # Fall back to original file if recovered file not available
-        if not file_to_parse:
-            file_to_parse = str(original_file_path)
+        # Prefer the recovered file; fall back to the uploaded one. Both resolve
+        # against MEDIA_ROOT (relative paths support Dockerized workers) and
+        # must stay inside it
+        recovered_path = recovered_file_path(mcap_log)
+        if recovered_path:
+            file_to_parse = str(recovered_path)
+            print(f"[parse_mcap_file] Using recovered file: {file_to_parse}")
+        else:
+            original_path = media_path(str(file_path))
+            if original_path is None:
+                raise FileNotFoundError(f"MCAP file is outside MEDIA_ROOT: {file_path}")
+            file_to_parse = str(original_path)
             print(f"[parse_mcap_file] Using original file: {file_to_parse}")
 
         # Helpful debug for Docker issues (shows exactly what path Celery is trying to read)
@@ -179,8 +204,8 @@ def parse_mcap_file(self, mcap_log_id, file_path):
             raise FileNotFoundError(f"MCAP file not found for parsing: {file_to_parse}")
         
         # Update parse status to processing
-        mcap_log.parse_status = "processing"
-        mcap_log.save(update_fields=['parse_status'])
+        _update_log(mcap_log_id, parse_status="processing")
+        publish_status(mcap_log_id, parse_status="processing")
         
         # Parse the MCAP file
         parsed_data = Parser.parse_stuff(file_to_parse)
@@ -199,6 +224,9 @@ def parse_mcap_file(self, mcap_log_id, file_path):
         # Create LineString from all GPS coordinates for map preview
         if all_coordinates:
             mcap_log.lap_path = LineString(all_coordinates, srid=4326)
+            # Any cached simplification was built from the old path
+            mcap_log.simplified_geojson = None
+            mcap_log.simplified_tolerance = None
         
         # Set captured_at from start_time
         if parsed_data.get("start_time"):
@@ -208,6 +236,7 @@ def parse_mcap_file(self, mcap_log_id, file_path):
         # Mark as completed
         mcap_log.parse_status = "completed"
         mcap_log.save()
+        publish_status(mcap_log_id, parse_status=mcap_log.parse_status)
         
         return f"Successfully parsed MCAP file for log {mcap_log_id}"
         
@@ -216,9 +245,9 @@ def parse_mcap_file(self, mcap_log_id, file_path):
     except Exception as e:
         # Update parse status with error
         try:
-            mcap_log = McapLog.objects.get(id=mcap_log_id)
-            mcap_log.parse_status = f"error: {str(e)}"
-            mcap_log.save(update_fields=['parse_status'])
+            parse_status = f"error: {str(e)}"
+            _update_log(mcap_log_id, parse_status=parse_status)
+            publish_status(mcap_log_id, parse_status=parse_status)
         except:
             pass
         
@@ -229,14 +258,45 @@ def parse_mcap_file(self, mcap_log_id, file_path):
         return f"Error parsing MCAP file: {str(e)}"
 
 
+@shared_task
+def parse_summary(path, cache_key=None):
+    """
+    Background task to parse an MCAP file summary without touching the database.
+    
+    Args:
+        path: Path to the MCAP file
+        cache_key: If given, the result is also stored in the Django cache under this key
+        
+    Returns:
+        The summary dict from Parser.parse_stuff
+    """
+    result = Parser.parse_stuff(path)
+    if cache_key:
+        cache.set(cache_key, result, timeout=PARSE_SUMMARY_CACHE_TTL)
+    return result
+
+
+def _is_retryable_conversion_error(error):
+    """
+    False for errors a retry can't fix: a missing source file, a bad format,
+    or a file the MCAP reader can't parse (McapToCsvConverter re-raises
+    those with the reader's error as the cause).
+    """
+    if isinstance(error, (FileNotFoundError, ValueError, McapError)):
+        return False
+    return not isinstance(error.__cause__, (FileNotFoundError, ValueError, McapError))
+
+
 @shared_task(bind=True, max_retries=3)
-def convert_mcap_to_csv(self, mcap_log_id, format='omni'):
+def convert_mcap_to_csv(self, mcap_log_id, format='omni', retry=True):
     """
     Background task to convert an MCAP file to CSV/LD format.
     
     Args:
         mcap_log_id: The ID of the McapLog record to convert
         format: Format profile ('omni', 'tvn', or 'ld')
+        retry: Retry failed conversions (never done for a missing or unreadable
+            file, which fails the same way every time)
         
     Returns:
         Path to the converted file
@@ -244,29 +304,8 @@ def convert_mcap_to_csv(self, mcap_log_id, format='omni'):
     try:
         mcap_log = McapLog.objects.get(id=mcap_log_id)
         
-        # Determine source file path
-        file_path = None
-        
-        # Try recovered_uri first if available and not pending
-        if mcap_log.recovered_uri and mcap_log.recovered_uri != "pending":
-            if mcap_log.recovered_uri.startswith(settings.MEDIA_URL):
-                file_name = mcap_log.recovered_uri.replace(settings.MEDIA_URL, '', 1)
-                file_path = Path(settings.MEDIA_ROOT) / file_name
-            elif mcap_log.recovered_uri.startswith('/'):
-                file_path = Path(mcap_log.recovered_uri)
-            else:
-                file_path = Path(settings.MEDIA_ROOT) / mcap_log.recovered_uri
-        
-        # Fall back to original_uri if recovered_uri not available
-        if not file_path or not file_path.exists():
-            if mcap_log.original_uri:
-                if mcap_log.original_uri.startswith(settings.MEDIA_URL):
-                    file_name = mcap_log.original_uri.replace(settings.MEDIA_URL, '', 1)
-                    file_path = Path(settings.MEDIA_ROOT) / file_name
-                elif mcap_log.original_uri.startswith('/'):
-                    file_path = Path(mcap_log.original_uri)
-                else:
-                    file_path = Path(settings.MEDIA_ROOT) / mcap_log.original_uri
+        # Prefer the recovered file, fall back to the original
+        file_path = conversion_source_path(mcap_log)
         
         if not file_path or not file_path.exists():
             raise FileNotFoundError(f"MCAP file not found for log {mcap_log_id}")
@@ -279,9 +318,7 @@ def convert_mcap_to_csv(self, mcap_log_id, format='omni'):
         
         # Generate output filename
         timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-        format_suffix = format.replace('csv_', '') if format.startswith('csv_') else format
-        # Use appropriate file extension based on format
-        file_extension = 'ld' if format_suffix == 'ld' else 'csv'
+        format_suffix, file_extension = conversion_output(format)
         output_filename = f"{mcap_log_id}_{format_suffix}_{timestamp}.{file_extension}"
         output_path = converted_dir / output_filename
         
@@ -297,8 +334,119 @@ def convert_mcap_to_csv(self, mcap_log_id, format='omni'):
         return f"McapLog with id {mcap_log_id} does not exist"
     except Exception as e:
         # Retry the task if it's a retryable error
-        if self.request.retries < self.max_retries:
+        if retry and _is_retryable_conversion_error(e) and self.request.retries < self.max_retries:
             raise self.retry(exc=e, countdown=60 * (self.request.retries + 1))
         
         return f"Error converting MCAP file to {format}: {str(e)}"
 
+
+@shared_task(bind=True)
+def build_download_zip(self, log_ids, format='mcap', cache_name=None):
+    """
+    Background task to build a download ZIP for several logs, so the HTTP
+    request that asked for it doesn't have to wait.
+    
+    Args:
+        log_ids: IDs of the McapLog records to include
+        format: 'mcap' for the original files, or 'csv_omni', 'csv_tvn', 'ld' to convert
+        cache_name: Download ETag. A complete ZIP is kept as <cache_name>.zip and
+            reused by later builds of the same logs and format.
+        
+    Returns:
+        Dict with 'file' (ZIP path relative to MEDIA_ROOT, or None if nothing
+        could be added), 'missing' (messages for logs that were skipped) and
+        'etag' (cache_name if the ZIP is complete, else None)
+    """
+    convert = format.startswith('csv_') or format == 'ld'
+    format_suffix, file_extension = conversion_output(format)
+    
+    downloads_dir = Path(settings.MEDIA_ROOT) / 'downloads'
+    downloads_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Reuse a complete ZIP of the same logs and format if one is still on disk
+    if cache_name:
+        cached_path = downloads_dir / f"{cache_name}.zip"
+        if cached_path.is_file():
+            cached_path.touch()  # restart its DOWNLOADS_MAX_AGE clock
+            return {
+                'file': str(cached_path.relative_to(settings.MEDIA_ROOT)),
+                'missing': [],
+                'etag': cache_name,
+            }
+    
+    # Build under the task's own name; renamed below once it is known to be complete
+    zip_path = downloads_dir / f"{self.request.id}.zip"
+    
+    # Drop stale archives (ones served through X-Accel-Redirect, or never fetched)
+    cutoff = datetime.datetime.now().timestamp() - settings.DOWNLOADS_MAX_AGE
+    for old_zip in downloads_dir.glob('*.zip'):
+        try:
+            if old_zip.stat().st_mtime < cutoff:
+                old_zip.unlink()
+        except OSError:
+            pass
+    
+    files_added = 0
+    missing = []
+    
+    # Same archive settings as the synchronous download: MCAP is already
+    # compressed, CSV compresses well at the fastest level
+    if convert:
+        zip_file = zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, allowZip64=True, compresslevel=1)
+    else:
+        zip_file = zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED, allowZip64=True)
+    
+    with zip_file:
+        # ZIP entries follow the order the IDs were requested in
+        position = {log_id: index for index, log_id in enumerate(log_ids)}
+        mcap_logs = sorted(
+            McapLog.objects.filter(id__in=log_ids).only(
+                'id', 'file_name', 'original_uri', 'recovered_uri'
+            ),
+            key=lambda mcap_log: position[mcap_log.id],
+        )
+        for mcap_log in mcap_logs:
+            label = f"{mcap_log.file_name} (ID: {mcap_log.id})"
+            try:
+                # Conversions prefer the recovered file; downloads ship the original
+                if convert:
+                    file_path = conversion_source_path(mcap_log)
+                else:
+                    file_path = original_file_path(mcap_log)
+                
+                if not file_path:
+                    missing.append(f"{label} - file not found")
+                    continue
+                
+                if not convert:
+                    write_to_zip(zip_file, file_path, mcap_log.file_name)
+                    files_added += 1
+                    continue
+                
+                # Convert into a scratch file, add it, then drop it
+                with tempfile.NamedTemporaryFile(suffix=f'.{file_extension}') as converted:
+                    converter = McapToCsvConverter()
+                    converter.convert_to_csv(str(file_path), converted.name, format=format_suffix)
+                    write_to_zip(zip_file, converted.name, converted_arcname(mcap_log.file_name, format))
+                files_added += 1
+            except (FileNotFoundError, IsADirectoryError):
+                missing.append(f"{label} - file not found")
+            except Exception as e:
+                missing.append(f"{label} - error: {str(e)}")
+    
+    if files_added == 0:
+        zip_path.unlink(missing_ok=True)
+        return {'file': None, 'missing': missing, 'etag': None}
+    
+    etag = None
+    if cache_name and not missing:
+        cached_path = downloads_dir / f"{cache_name}.zip"
+        zip_path.replace(cached_path)
+        zip_path = cached_path
+        etag = cache_name
+    
+    return {
+        'file': str(zip_path.relative_to(settings.MEDIA_ROOT)),
+        'missing': missing,
+        'etag': etag,
+    }
@@ -1,3 +1,178 @@
-from django.test import TestCase
+import hashlib
+import io
+import os
+import struct
+import tempfile
+import zipfile
+from contextlib import suppress
 
-# Create your tests here.
+from django.contrib.gis.geos import GEOSGeometry
+from django.core.files.uploadhandler import StopFutureHandlers
+from django.test import RequestFactory, SimpleTestCase
+
+from .files import write_to_zip
+from .gpsparse import GpsParser
+from .upload_handlers import Sha256MemoryFileUploadHandler, Sha256TemporaryFileUploadHandler
+from .views import _bbox_from_str, _etag_matches
+
+
+def _upload(handler, chunks):
+    """Feed chunks through an upload handler the way MultiPartParser does; return its file."""
+    size = sum(len(chunk) for chunk in chunks)
+    handler.handle_raw_input(None, {}, size, 'boundary', 'utf-8')
+    # MemoryFileUploadHandler signals that it takes the file by raising
+    with suppress(StopFutureHandlers):
+        handler.new_file('files', 'log.mcap', 'application/octet-stream', size)
+    start = 0
+    for chunk in chunks:
+        handler.receive_data_chunk(chunk, start)
+        start += len(chunk)
+    return handler.file_complete(size)
+
+
+class Sha256UploadHandlerTests(SimpleTestCase):
+    chunks = [b'\x00' * 1000, b'mcap' * 300, b'', b'\xff' * 7]
+
+    def test_memory_handler_hashes_every_chunk(self):
+        uploaded_file = _upload(Sha256MemoryFileUploadHandler(), self.chunks)
+        self.assertEqual(uploaded_file.sha256, hashlib.sha256(b''.join(self.chunks)).hexdigest())
+
+    def test_temporary_handler_hashes_every_chunk(self):
+        uploaded_file = _upload(Sha256TemporaryFileUploadHandler(), self.chunks)
+        try:
+            self.assertEqual(uploaded_file.sha256, hashlib.sha256(b''.join(self.chunks)).hexdigest())
+        finally:
+            uploaded_file.close()
+
+    def test_empty_upload(self):
+        uploaded_file = _upload(Sha256MemoryFileUploadHandler(), [])
+        self.assertEqual(uploaded_file.sha256, hashlib.sha256(b'').hexdigest())
+
+    def test_memory_handler_skips_uploads_it_does_not_store(self):
+        # Too large to keep in memory: the chunks pass on to the next handler unhashed
+        handler = Sha256MemoryFileUploadHandler()
+        with self.settings(FILE_UPLOAD_MAX_MEMORY_SIZE=10):
+            self.assertIsNone(_upload(handler, self.chunks))
+        self.assertEqual(handler.sha256.hexdigest(), hashlib.sha256(b'').hexdigest())
+
+
+class LinestringWkbTests(SimpleTestCase):
+    coordinates = [[-84.5821, 34.0381], [-84.5819, 34.0383], [-84.58175, 34.03847]]
+
+    def test_header(self):
+        wkb = GpsParser.linestring_wkb(self.coordinates)
+        byte_order = '<' if wkb[0] == 1 else '>'
+        geometry_type, point_count = struct.unpack_from(f'{byte_order}II', wkb, 1)
+        self.assertEqual(geometry_type, 2)
+        self.assertEqual(point_count, len(self.coordinates))
+        self.assertEqual(len(wkb), 9 + 16 * len(self.coordinates))
+
+    def test_decodes_to_the_same_linestring(self):
+        geometry = GEOSGeometry(memoryview(GpsParser.linestring_wkb(self.coordinates)))
+        self.assertEqual(geometry.geom_type, 'LineString')
+        self.assertEqual([list(point) for point in geometry.coords], self.coordinates)
+
+    def test_accepts_tuples(self):
+        coordinates = [tuple(point) for point in self.coordinates]
+        self.assertEqual(
+            GpsParser.linestring_wkb(coordinates),
+            GpsParser.linestring_wkb(self.coordinates),
+        )
+
+
+class BboxFromStrTests(SimpleTestCase):
+    def test_valid_box(self):
+        bbox = _bbox_from_str('-84.6,34.0,-84.5,34.1')
+        self.assertEqual(bbox.extent, (-84.6, 34.0, -84.5, 34.1))
+
+    def test_whitespace_around_coordinates(self):
+        bbox = _bbox_from_str(' -84.6 , 34 ,-84.5,  34.1 ')
+        self.assertEqual(bbox.extent, (-84.6, 34.0, -84.5, 34.1))
+
+    def test_malformed(self):
+        for location in [
+            '',
+            '-84.6,34.0,-84.5',
+            '-84.6,34.0,-84.5,34.1,0',
+            'a,b,c,d',
+            '-84.6,34.0,-84.5,34.1x',
+            '-84.6;34.0;-84.5;34.1',
+            '1e2,34.0,-84.5,34.1',
+            '-84.6,,-84.5,34.1',
+        ]:
+            with self.subTest(location=location):
+                self.assertIsNone(_bbox_from_str(location))
+
+    def test_inverted(self):
+        self.assertIsNone(_bbox_from_str('-84.5,34.0,-84.6,34.1'))
+        self.assertIsNone(_bbox_from_str('-84.6,34.1,-84.5,34.0'))
+
+    def test_single_point_box(self):
+        self.assertEqual(_bbox_from_str('-84.5,34.0,-84.5,34.0').extent, (-84.5, 34.0, -84.5, 34.0))
+
+
+class EtagMatchesTests(SimpleTestCase):
+    etag = 'mcaplog-3-1760000000'
+
+    def _matches(self, if_none_match=None):
+        headers = {} if if_none_match is None else {'HTTP_IF_NONE_MATCH': if_none_match}
+        return _etag_matches(RequestFactory().get('/', **headers), self.etag)
+
+    def test_exact_match(self):
+        self.assertTrue(self._matches(f'"{self.etag}"'))
+
+    def test_weak_match(self):
+        self.assertTrue(self._matches(f'W/"{self.etag}"'))
+
+    def test_match_in_list(self):
+        self.assertTrue(self._matches(f'"other", W/"{self.etag}", "another"'))
+
+    def test_wildcard(self):
+        self.assertTrue(self._matches('*'))
+        self.assertTrue(self._matches(' * '))
+
+    def test_different_etag(self):
+        self.assertFalse(self._matches('"other"'))
+        self.assertFalse(self._matches(f'"{self.etag}-2"'))
+        self.assertFalse(self._matches(f'"x{self.etag}"'))
+
+    def test_unquoted_etag(self):
+        self.assertFalse(self._matches(self.etag))
+
+    def test_missing_header(self):
+        self.assertFalse(self._matches())
+        self.assertFalse(self._matches(''))
+
+
+class WriteToZipTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        source = tempfile.NamedTemporaryFile(suffix='.csv', delete=False)
+        with source:
+            source.write(b''.join(b'%d,%f,%f\n' % (i, i * 0.37, i / 7) for i in range(50000)))
+        cls.source_path = source.name
+        cls.addClassCleanup(os.remove, source.name)
+
+    def _compressed_size(self, compresslevel, add):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zip_file:
+            add(zip_file, self.source_path, 'log.csv')
+        with zipfile.ZipFile(buffer) as zip_file:
+            return zip_file.getinfo('log.csv').compress_size
+
+    def test_uses_the_archive_compression_level(self):
+        self.assertLess(self._compressed_size(9, write_to_zip), self._compressed_size(1, write_to_zip))
+
+    def test_matches_zipfile_write(self):
+        self.assertEqual(
+            self._compressed_size(1, write_to_zip),
+            self._compressed_size(1, zipfile.ZipFile.write),
+        )
+
+    def test_contents(self):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zip_file:
+            write_to_zip(zip_file, self.source_path, 'log.csv')
+        with zipfile.ZipFile(buffer) as zip_file, open(self.source_path, 'rb') as source:
+            self.assertEqual(zip_file.read('log.csv'), source.read())
@@ -0,0 +1,46 @@
+"""
+Upload handlers that compute a SHA-256 of each uploaded file while Django receives it.
+
+The digest is attached to the resulting UploadedFile as `sha256`, so views can store
+it without reading the file back from memory or disk.
+"""
+import hashlib
+
+from django.core.files.uploadhandler import (
+    MemoryFileUploadHandler,
+    TemporaryFileUploadHandler,
+)
+
+
+class Sha256UploadHandlerMixin:
+    # Read the request body (and write the spooled temp file) in 1 MB pieces
+    # instead of Django's 64 KB, so a large MCAP upload takes far fewer
+    # read/write calls. The multipart parser uses the smallest chunk_size of
+    # all handlers, so both handlers below need it.
+    chunk_size = 1024 * 1024
+
+    def new_file(self, *args, **kwargs):
+        # Set before super(): MemoryFileUploadHandler.new_file raises StopFutureHandlers
+        self.sha256 = hashlib.sha256()
+        super().new_file(*args, **kwargs)
+
+    def receive_data_chunk(self, raw_data, start):
+        remaining = super().receive_data_chunk(raw_data, start)
+        # None means this handler consumed the chunk (it is the one storing the file)
+        if remaining is None:
+            self.sha256.update(raw_data)
+        return remaining
+
+    def file_complete(self, file_size):
+        uploaded_file = super().file_complete(file_size)
+        if uploaded_file is not None:
+            uploaded_file.sha256 = self.sha256.hexdigest()
+        return uploaded_file
+
+
+class Sha256MemoryFileUploadHandler(Sha256UploadHandlerMixin, MemoryFileUploadHandler):
+    pass
+
+
+class Sha256TemporaryFileUploadHandler(Sha256UploadHandlerMixin, TemporaryFileUploadHandler):
+    pass
@@ -4,33 +4,391 @@ from .models import McapLog, Car, Driver, EventType
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.exceptions import NotFound
+from rest_framework.generics import get_object_or_404
 from .serializers import (
     McapLogSerializer, 
+    McapLogListSerializer,
     ParseSummaryRequestSerializer,
     CarSerializer,
     DriverSerializer,
     EventTypeSerializer,
     DownloadRequestSerializer
 )
-from .parser import Parser
 from .gpsparse import GpsParser
-from .tasks import parse_mcap_file, recover_mcap_file
+from .events import STATUS_CHANNEL, get_redis
+from .files import converted_arcname, original_file_path, write_to_zip
+from .pagination import JobStatusPagination, McapLogCursorPagination
+from .signals import bump_mcap_log_version, list_cache_key, mcap_log_version
+from .tasks import (
+    build_download_zip,
+    convert_mcap_to_csv,
+    parse_mcap_file,
+    parse_summary,
+    recover_mcap_file,
+)
+from backend import celery_app
 import os
 import datetime
+import hashlib
+import io
+import logging
+import math
+import re
+import shutil
 import zipfile
 import tempfile
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from django.http import FileResponse, HttpResponse
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
 from django.utils import timezone
-from django.contrib.gis.geos import LineString, Point, Polygon
+from django.utils.dateparse import parse_date
+from django.contrib.gis.geos import Point, Polygon
 from django.conf import settings
-from django.db.models import Q
+from django.db import connection, transaction
+from django.core.cache import cache
+from django.contrib.gis.db.models import GeometryField
+from django.db.models import BooleanField, Case, F, Func, IntegerField, Q, TextField, Value, When
+from celery import group, states as celery_states
+from celery.backends.base import BaseKeyValueStoreBackend
+from celery.exceptions import TimeoutError as CeleryTimeoutError
 from celery.result import AsyncResult
+from celery.utils import uuid as celery_uuid
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Timezone used to turn start_date/end_date query params into day boundaries.
+# Resolved once; the project never activates a per-request timezone.
+_FILTER_TZ = timezone.get_default_timezone()
+
+# ?location=min_lon,min_lat,max_lon,max_lat (whitespace around values is allowed)
+_COORD = r'\s*(-?\d+(?:\.\d+)?)\s*'
+_LOCATION_RE = re.compile(rf'{_COORD},{_COORD},{_COORD},{_COORD}')
+
+# MCAP downloads whose files add up to less than this are zipped in memory
+IN_MEMORY_ZIP_MAX_BYTES = 50 * 1000 * 1000
+
+# Paths with this many points or fewer are returned as-is by the geojson endpoint
+SIMPLIFY_MIN_POINTS = 50
+
+# Decimal places in geojson coordinates (6 is about 0.1 m)
+GEOJSON_PRECISION = 6
+
+# Seconds a job_statuses response is reused; bounds how stale Celery task states can be
+JOB_STATUSES_CACHE_TTL = 5
+
+# Seconds job-status reuses a Celery task's state: briefly while it runs, longer once finished
+TASK_STATUS_TTL = 2
+TASK_STATUS_READY_TTL = 60 * 60
+
+# Seconds ParseSummaryView waits for the parse task when called with ?sync=true
+PARSE_SUMMARY_SYNC_TIMEOUT = 30
+
+# Seconds the Car/Driver/EventType list responses stay cached (also invalidated on change)
+LOOKUP_LIST_CACHE_TTL = 24 * 60 * 60
+
+# Seconds between keepalive comments on an idle status event stream
+STATUS_EVENTS_KEEPALIVE = 15
+
+# Seconds a status event stream stays open. Each open stream holds a web worker
+# thread, so streams end after this and EventSource reconnects (and resyncs)
+STATUS_EVENTS_MAX_AGE = 5 * 60
+
+# Milliseconds EventSource waits before reconnecting after a stream ends
+STATUS_EVENTS_RETRY_MS = 1000
+
+# Seconds a CSV/LD download waits for its conversion tasks to finish
+CONVERSION_TIMEOUT = 5 * 60
+
+# Buffer size used when copying in-memory uploads to disk (Django's default chunk is 64 KB)
+UPLOAD_COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def _save_uploaded_file(uploaded_file, file_path):
+    """
+    Save an uploaded file to file_path.
+    Uploads Django already spooled to a temp file on disk are moved into place
+    (a rename on the same filesystem) instead of being copied byte by byte.
+    Across filesystems shutil.move falls back to a kernel-side copy
+    (sendfile/copy_file_range) rather than a Python read/write loop.
+    In-memory uploads are streamed with shutil.copyfileobj using a 1 MB buffer.
+    """
+    if isinstance(uploaded_file, TemporaryUploadedFile):
+        shutil.move(uploaded_file.temporary_file_path(), file_path)
+        # Temp files are created 0600; match the permissions a normal upload would get
+        if settings.FILE_UPLOAD_PERMISSIONS is not None:
+            os.chmod(file_path, settings.FILE_UPLOAD_PERMISSIONS)
+        return
+
+    uploaded_file.seek(0)
+    with open(file_path, 'wb') as destination:
+        shutil.copyfileobj(uploaded_file, destination, length=UPLOAD_COPY_BUFFER_SIZE)
+
+
+@lru_cache(maxsize=1)
+def _mcap_log_output_fields():
+    """Names of the fields McapLogSerializer renders (its Meta.fields minus write-only ones)."""
+    return tuple(
+        name for name, field in McapLogSerializer().fields.items() if not field.write_only
+    )
+
+
+def _fetch_task_states(task_ids):
+    """
+    Look up Celery task states for many task IDs at once.
+    Finished tasks can't change state, so theirs are kept in the Django cache
+    for TASK_STATUS_READY_TTL and read back with one get_many. The rest are
+    read from key-value result backends (Redis) with a single MGET. Other
+    backends fall back to one AsyncResult lookup per task.
+    Returns {task_id: state}; tasks with no stored result are PENDING.
+    """
+    task_ids = list(dict.fromkeys(task_ids))
+    if not task_ids:
+        return {}
+    
+    cache_keys = {f"task_state:{task_id}": task_id for task_id in task_ids}
+    task_states = {
+        cache_keys[key]: state for key, state in cache.get_many(cache_keys).items()
+    }
+    uncached_ids = [task_id for task_id in task_ids if task_id not in task_states]
+    if not uncached_ids:
+        return task_states
+    
+    backend = celery_app.backend
+    if isinstance(backend, BaseKeyValueStoreBackend):
+        values = backend.mget([backend.get_key_for_task(task_id) for task_id in uncached_ids])
+        fetched = {
+            task_id: backend.decode_result(value)['status'] if value else celery_states.PENDING
+            for task_id, value in zip(uncached_ids, values)
+        }
+    else:
+        fetched = {
+            task_id: AsyncResult(task_id, app=celery_app).state for task_id in uncached_ids
+        }
+    
+    task_states.update(fetched)
+    cache.set_many(
+        {
+            f"task_state:{task_id}": state
+            for task_id, state in fetched.items()
+            if state in celery_states.READY_STATES
+        },
+        timeout=TASK_STATUS_READY_TTL,
+    )
+    return task_states
+
+
+@lru_cache(maxsize=1024)
+def _bbox_from_str(location):
+    """
+    Polygon for a ?location=min_lon,min_lat,max_lon,max_lat value, or None if it
+    is malformed or inverted. Cached by string: the map sends the same few boxes
+    over and over. The returned Polygon is shared, so callers must not modify it.
+    """
+    # Parse and validate the four coordinates in one pass
+    match = _LOCATION_RE.fullmatch(location)
+    if not match:
+        return None
+    min_lon, min_lat, max_lon, max_lat = map(float, match.groups())
+    # Skip inverted boxes rather than building a degenerate polygon
+    if min_lon > max_lon or min_lat > max_lat:
+        return None
+    return Polygon.from_bbox((min_lon, min_lat, max_lon, max_lat))
+
+
+def _ids_with_name_containing(model, text):
+    """IDs of a lookup model (Car, Driver, EventType) whose name contains text, case-insensitively."""
+    return list(model.objects.filter(name__icontains=text).values_list('id', flat=True))
+
+
+def _lap_path_geometry():
+    """
+    lap_path cast from geography to geometry. Matches the expression of the
+    mcaplog_lap_path_geom_gix index, so filters on it can use that index.
+    """
+    return Func(
+        F('lap_path'),
+        template='%(expressions)s::geometry',
+        output_field=GeometryField(srid=4326)
+    )
+
+
+def _with_path_geojson(queryset, simplify, tolerance):
+    """
+    Annotate queryset rows with path_geojson: lap_path encoded by PostGIS
+    ST_AsGeoJSON, run through ST_SimplifyVW first when simplify is set.
+    Paths of SIMPLIFY_MIN_POINTS points or fewer are not simplified.
+    Simplified rows are also annotated with simplified_cached, True when
+    path_geojson came from the stored simplified_geojson.
+    """
+    if not simplify:
+        return queryset.annotate(path_geojson=_as_geojson(F('lap_path')))
+    
+    # ST_SimplifyVW works with geometry, not geography, so cast with ::geometry
+    return queryset.alias(
+        geometry_path=_lap_path_geometry(),
+        num_points=Func(F('geometry_path'), function='ST_NPoints', output_field=IntegerField()),
+    ).alias(
+        output_path=Case(
+            When(
+                num_points__gt=SIMPLIFY_MIN_POINTS,
+                then=Func(
+                    F('geometry_path'),
+                    Value(tolerance),
+                    function='ST_SimplifyVW',
+                    output_field=GeometryField(srid=4326)
+                ),
+            ),
+            default=F('geometry_path'),
+            output_field=GeometryField(srid=4326),
+        )
+    ).annotate(
+        # Reuse the stored simplification when it was built with this tolerance;
+        # CASE only evaluates ST_SimplifyVW when it wasn't
+        simplified_cached=Case(
+            When(simplified_tolerance=tolerance, simplified_geojson__isnull=False, then=Value(True)),
+            default=Value(False),
+            output_field=BooleanField(),
+        )
+    ).annotate(
+        path_geojson=Case(
+            When(simplified_cached=True, then=F('simplified_geojson')),
+            default=_as_geojson(F('output_path')),
+            output_field=TextField(),
+        )
+    )
+
+
+def _as_geojson(expression):
+    """PostGIS ST_AsGeoJSON of a geometry/geography expression, as text."""
+    return Func(
+        expression,
+        Value(GEOJSON_PRECISION),
+        function='ST_AsGeoJSON',
+        output_field=TextField()
+    )
+
+
+class _DeleteOnCloseFile(io.BufferedReader):
+    """A file opened for reading that deletes itself from disk when it is closed."""
+    def __init__(self, path):
+        super().__init__(io.FileIO(path, 'rb'))
+        self._path = path
+
+    def close(self):
+        try:
+            super().close()
+        finally:
+            try:
+                os.unlink(self._path)
+            except FileNotFoundError:
+                pass
+
+
+def _zip_file_response(zip_path, zip_filename, delete=True):
+    """
+    Stream a ZIP file from disk, deleting it when the response is closed unless
+    delete is False. FileResponse goes through the server's wsgi.file_wrapper,
+    so servers that support it (e.g. gunicorn) send the file with sendfile(2).
+    """
+    return FileResponse(
+        _DeleteOnCloseFile(zip_path) if delete else open(zip_path, 'rb'),
+        as_attachment=True,
+        filename=zip_filename,
+        content_type='application/zip',
+    )
+
+
+def _download_etag(mcap_logs, output_format):
+    """
+    ETag for a download: the ZIP only changes if the set of logs, the format,
+    or one of the logs (updated_at) does.
+    """
+    last_update = max(mcap_log.updated_at for mcap_log in mcap_logs)
+    key = f"{sorted(mcap_log.id for mcap_log in mcap_logs)}|{output_format}|{last_update.isoformat()}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _etag_matches(request, etag):
+    """True if the request's If-None-Match already names this ETag."""
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH', '')
+    return f'"{etag}"' in if_none_match or if_none_match.strip() == '*'
+
+
+def _task_status(task_id):
+    """
+    (state, info) for a Celery task, as reported by job-status.
+    Cached so polling clients share result-backend lookups: finished tasks
+    can't change, so they are kept for TASK_STATUS_READY_TTL; running ones
+    for TASK_STATUS_TTL.
+    """
+    cache_key = f"task_status:{task_id}"
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    # One backend read; everything below comes from the same meta
+    task_result = AsyncResult(task_id, app=celery_app)
+    task_state = task_result.state
+    ready = task_state in celery_states.READY_STATES
+    task_info = {
+        'ready': ready,
+        'successful': task_state == celery_states.SUCCESS if ready else None,
+        'failed': task_state == celery_states.FAILURE if ready else None,
+    }
+    
+    # Add result or error if available
+    if task_state == celery_states.SUCCESS:
+        task_info['result'] = task_result.result
+    elif task_state == celery_states.FAILURE:
+        task_info['error'] = str(task_result.info)
+    
+    cache.set(
+        cache_key,
+        (task_state, task_info),
+        timeout=TASK_STATUS_READY_TTL if ready else TASK_STATUS_TTL
+    )
+    return task_state, task_info
+
+
+def _parse_summary_cache_key(path):
+    """
+    Cache key for the parse summary of the file at path.
+    Includes the file's mtime and size so a rewritten file gets a new key.
+    Returns None if the file can't be stat'ed (the parse task reports the error).
+    """
+    try:
+        stat_result = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    path_hash = hashlib.sha256(os.fsencode(path)).hexdigest()
+    return f"parse_summary:{path_hash}:{stat_result.st_mtime_ns}:{stat_result.st_size}"
+
 
 class McapLogViewSet(viewsets.ModelViewSet):
     queryset = McapLog.objects.all()
     serializer_class = McapLogSerializer
     
+    @property
+    def paginator(self):
+        """
+        Page-number pagination by default (the frontend's page controls need
+        page numbers and a count); ?pagination=cursor switches the list to
+        cursor pagination.
+        """
+        if not hasattr(self, '_paginator'):
+            if self.request.query_params.get('pagination') == 'cursor':
+                self._paginator = McapLogCursorPagination()
+            else:
+                self._paginator = super().paginator
+        return self._paginator
+    
     def get_queryset(self):
         """
         Override DRF's get_queryset() to add custom filtering logic.
@@ -47,8 +405,10 @@ class McapLogViewSet(viewsets.ModelViewSet):
         - driver_id: Filter by driver ID (integer)
         - parse_status: Filter by parse status (string, e.g., "completed", "pending")
         - recovery_status: Filter by recovery status (string)
-        - location: Filter by geographic bounding box (format: min_lon,min_lat,max_lon,max_lat)
+        - location: Filter by geographic bounding box (format: min_lon,min_lat,max_lon,max_lat);
+          matches logs whose GPS path bounding box overlaps it
         - page: Page number for pagination (default: 1, handled by DRF pagination)
+        - pagination=cursor: Use cursor pagination instead (follow the next/previous links)
         
         Returns: Filtered queryset ordered by creation date (newest first)
         """
@@ -63,12 +423,16 @@ class McapLogViewSet(viewsets.ModelViewSet):
         if search:
             search = str(search).strip()
             if search:
+                # Resolve the matching car/driver/event_type IDs up front (the
+                # lookup tables are tiny) so every branch below is a predicate
+                # on api_mcaplog itself. With no joins in the OR, Postgres can
+                # combine the pk, FK and trigram indexes in one bitmap scan.
                 q = (
                     Q(file_name__icontains=search)
                     | Q(notes__icontains=search)
-                    | Q(car__name__icontains=search)
-                    | Q(driver__name__icontains=search)
-                    | Q(event_type__name__icontains=search)
+                    | Q(car_id__in=_ids_with_name_containing(Car, search))
+                    | Q(driver_id__in=_ids_with_name_containing(Driver, search))
+                    | Q(event_type_id__in=_ids_with_name_containing(EventType, search))
                 )
 
                 # If search is numeric, also match ID exactly
@@ -85,12 +449,11 @@ class McapLogViewSet(viewsets.ModelViewSet):
         start_date = self.request.query_params.get('start_date', None)
         if start_date:
             try:
-                from django.utils.dateparse import parse_date
                 date_obj = parse_date(start_date)
                 if date_obj:
                     # Convert to start of day (00:00:00) with timezone awareness
-                    start_datetime = timezone.make_aware(
-                        datetime.datetime.combine(date_obj, datetime.time.min)
+                    start_datetime = datetime.datetime.combine(
+                        date_obj, datetime.time.min, tzinfo=_FILTER_TZ
                     )
                     queryset = queryset.filter(captured_at__gte=start_datetime)
             except (ValueError, TypeError):
@@ -100,12 +463,11 @@ class McapLogViewSet(viewsets.ModelViewSet):
         end_date = self.request.query_params.get('end_date', None)
         if end_date:
             try:
-                from django.utils.dateparse import parse_date
                 date_obj = parse_date(end_date)
                 if date_obj:
                     # Convert to end of day (23:59:59) with timezone awareness
-                    end_datetime = timezone.make_aware(
-                        datetime.datetime.combine(date_obj, datetime.time.max)
+                    end_datetime = datetime.datetime.combine(
+                        date_obj, datetime.time.max, tzinfo=_FILTER_TZ
                     )
                     queryset = queryset.filter(captured_at__lte=end_datetime)
             except (ValueError, TypeError):
@@ -151,24 +513,45 @@ class McapLogViewSet(viewsets.ModelViewSet):
         # Filter logs by geographic bounding box (PostGIS spatial query)
         # Format: min_lon,min_lat,max_lon,max_lat (comma-separated)
         # Example: ?location=-122.5,37.7,-122.3,37.9
-        # Returns logs whose lap_path (GPS LineString) intersects with the bounding box
+        # Returns logs whose lap_path (GPS LineString) bounding box overlaps the given box
         location = self.request.query_params.get('location', None)
         if location:
-            try:
-                # Parse comma-separated coordinates
-                coords = [float(x.strip()) for x in location.split(',')]
-                if len(coords) == 4:
-                    min_lon, min_lat, max_lon, max_lat = coords
-                    # Create bounding box polygon using PostGIS
-                    bbox = Polygon.from_bbox((min_lon, min_lat, max_lon, max_lat))
-                    # Filter logs where lap_path intersects with bounding box
-                    queryset = queryset.filter(lap_path__intersects=bbox)
-            except (ValueError, TypeError, IndexError):
-                pass  # Ignore invalid location formats silently
+            bbox = _bbox_from_str(location)
+            if bbox is not None:
+                # Filter logs whose lap_path bounding box overlaps the box (&&).
+                # This is answered from the lap_path::geometry GiST index
+                # alone, without an exact ST_Intersects test per candidate.
+                # Compare as geometry: the box edges are lon/lat lines, not
+                # great circles
+                queryset = queryset.alias(
+                    geometry_path=_lap_path_geometry()
+                ).filter(geometry_path__bboverlaps=bbox)
+            # Invalid location formats are ignored silently
         
         # Return filtered queryset ordered by creation date (newest first)
         # Pagination is handled automatically by DRF after this method returns
-        return queryset.order_by('-created_at')
+        queryset = queryset.order_by('-created_at')
+        
+        # The list view renders flat rows: fetch dicts instead of model instances,
+        # skip lap_path, and pull FK names in the same query
+        if self.action == 'list':
+            queryset = queryset.values(*McapLogListSerializer.values_fields)
+        elif self.action in ('retrieve', 'update', 'partial_update'):
+            # McapLogSerializer nests car/driver/event_type: join them instead
+            # of issuing one query per relation. It doesn't render the cached
+            # simplified GeoJSON, so leave that column in the database.
+            queryset = queryset.select_related('car', 'driver', 'event_type').defer('simplified_geojson')
+        else:
+            # Other actions (job-status, destroy, ...) never read the path
+            # columns, which can be hundreds of KB per row
+            queryset = queryset.defer('lap_path', 'simplified_geojson')
+        
+        return queryset
+    
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return McapLogListSerializer
+        return super().get_serializer_class()
     
     def list(self, request, *args, **kwargs):
         """
@@ -193,26 +576,24 @@ class McapLogViewSet(viewsets.ModelViewSet):
         saved_file_relpath = None
         
         if uploaded_file:
-            # Create media directory if it doesn't exist
+            # Created at startup by ApiConfig.ready()
             media_dir = settings.MEDIA_ROOT / 'mcap_logs'
-            media_dir.mkdir(parents=True, exist_ok=True)
             
             # Generate unique filename to avoid conflicts
-            timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-            file_name = f"{timestamp}_{uploaded_file.name}"
+            file_name = f"{uuid.uuid4().hex}_{uploaded_file.name}"
             file_path = media_dir / file_name
             
             # Save the uploaded file
-            with open(file_path, 'wb+') as destination:
-                for chunk in uploaded_file.chunks():
-                    destination.write(chunk)
+            _save_uploaded_file(uploaded_file, file_path)
             
             # Store relative path so Celery workers (possibly in Docker) can resolve via MEDIA_ROOT
             saved_file_relpath = str(file_path.relative_to(settings.MEDIA_ROOT))
             
-            # Calculate and store file size
-            file_size = file_path.stat().st_size
+            # Store file size (already known from the upload, no need to stat)
+            file_size = uploaded_file.size
             serializer.validated_data['file_size'] = file_size
+            # Digest computed by the upload handler while the file streamed in
+            serializer.validated_data['file_sha256'] = getattr(uploaded_file, 'sha256', None)
             
             # Store the URI in original_uri
             serializer.validated_data['original_uri'] = f"{settings.MEDIA_URL}mcap_logs/{file_name}"
@@ -222,6 +603,10 @@ class McapLogViewSet(viewsets.ModelViewSet):
             
             # Set parse_status to pending - will be processed in background
             serializer.validated_data['parse_status'] = "pending"
+            
+            # Pre-assign the recovery task ID so the initial INSERT already stores it
+            recovery_task_id = celery_uuid()
+            serializer.validated_data['parse_task_id'] = recovery_task_id
         else:
             # If no file uploaded, ensure file_name is set if provided in request
             if 'file_name' not in serializer.validated_data or not serializer.validated_data.get('file_name'):
@@ -237,11 +622,13 @@ class McapLogViewSet(viewsets.ModelViewSet):
         
         # If a file was uploaded, trigger recovery (which will trigger parsing when done)
         if saved_file_relpath:
-            # Recovery task will trigger parsing automatically when it completes
-            recovery_task = recover_mcap_file.delay(mcap_log_instance.id, saved_file_relpath)
-            # Store the recovery task ID for status tracking
-            mcap_log_instance.parse_task_id = recovery_task.id
-            mcap_log_instance.save(update_fields=['parse_task_id'])
+            # Recovery task will trigger parsing automatically when it completes.
+            # Dispatch on commit so the worker never picks up a row it cannot see yet.
+            mcap_log_id = mcap_log_instance.id
+            transaction.on_commit(lambda: recover_mcap_file.apply_async(
+                args=(mcap_log_id, saved_file_relpath),
+                task_id=recovery_task_id,
+            ))
         
         headers = self.get_success_headers(serializer.data)
         return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
@@ -253,113 +640,96 @@ class McapLogViewSet(viewsets.ModelViewSet):
         Reads from DB if available, otherwise parses from MCAP file.
         By default returns the full unsimplified path. Use ?simplify=true to enable simplification.
         """
-        mcap_log = self.get_object()
+        # Check if simplification is requested
+        simplify = request.query_params.get('simplify', 'false').lower() == 'true'
+        
+        # Get tolerance parameter from query string (default: 0.00001 degrees, roughly 1.1 meters)
+        tolerance = 0
+        if simplify:
+            try:
+                tolerance = float(request.query_params.get('tolerance', 0.00001))
+            except ValueError:
+                tolerance = math.nan
+            # nan/inf/negative would reach ST_SimplifyVW and the simplified_tolerance cache
+            if not math.isfinite(tolerance) or tolerance < 0:
+                return Response(
+                    {'error': 'tolerance must be a non-negative number'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        
+        # Fetch the (optionally simplified) path as GeoJSON in the same SELECT as
+        # the row, so the full geography is never shipped just to be simplified
+        queryset = _with_path_geojson(
+            self.filter_queryset(self.get_queryset()).only('id', 'original_uri'),
+            simplify and tolerance > 0,
+            tolerance,
+        )
+        mcap_log = get_object_or_404(queryset, pk=pk)
+        self.check_object_permissions(request, mcap_log)
         
         # Get or parse lap_path
-        lap_path = mcap_log.lap_path
+        path_geojson = mcap_log.path_geojson
         
         # If lap_path doesn't exist in DB, try to parse from MCAP file
-        if not lap_path and mcap_log.original_uri:
+        if not path_geojson and mcap_log.original_uri:
             try:
-                # Extract file path from original_uri
-                # original_uri format: /media/mcap_logs/filename.mcap
-                if mcap_log.original_uri.startswith(settings.MEDIA_URL):
-                    file_name = mcap_log.original_uri.replace(settings.MEDIA_URL, '')
-                    file_path = settings.MEDIA_ROOT / file_name
+                file_path = original_file_path(mcap_log)
+                if file_path and file_path.exists():
+                    # Parse GPS coordinates from MCAP file
+                    gps_data = GpsParser.parse_gps(str(file_path))
+                    all_coordinates = gps_data.get("all_coordinates", [])
                     
-                    if file_path.exists():
-                        # Parse GPS coordinates from MCAP file
-                        gps_data = GpsParser.parse_gps(str(file_path))
-                        all_coordinates = gps_data.get("all_coordinates", [])
-                        
-                        if all_coordinates:
-                            lap_path = LineString(all_coordinates, srid=4326)
-                            # Optionally save to DB for future use
-                            mcap_log.lap_path = lap_path
-                            mcap_log.save(update_fields=['lap_path'])
+                    # A LineString needs at least two points
+                    if len(all_coordinates) >= 2:
+                        # Save to DB for future use with a single UPDATE. The
+                        # path goes over as one WKB buffer; no GEOS object
+                        # is built in Python.
+                        with connection.cursor() as cursor:
+                            cursor.execute(
+                                f"UPDATE {McapLog._meta.db_table} "
+                                "SET lap_path = ST_GeomFromWKB(%s, 4326)::geography, "
+                                "simplified_geojson = NULL, simplified_tolerance = NULL, "
+                                "updated_at = %s WHERE id = %s",
+                                [GpsParser.linestring_wkb(all_coordinates), timezone.now(), mcap_log.pk]
+                            )
+                        # First request for this log: encode (and simplify) the
+                        # path just saved
+                        path_geojson = queryset.get(pk=mcap_log.pk).path_geojson
             except Exception as e:
                 return Response(
                     {'error': f'Failed to parse MCAP file: {str(e)}'},
                     status=status.HTTP_500_INTERNAL_SERVER_ERROR
                 )
         
-        if not lap_path:
+        if not path_geojson:
             return Response(
                 {'error': 'No GPS path available for this log'},
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        # Check if simplification is requested
-        simplify = request.query_params.get('simplify', 'false').lower() == 'true'
-        
-        if simplify:
-            # Simplify using PostGIS ST_SimplifyVW
-            # Get tolerance parameter from query string (default: 0.00001 degrees, roughly 1.1 meters)
-            tolerance = float(request.query_params.get('tolerance', 0.00001))
-            
-            try:
-                # Use PostGIS ST_SimplifyVW function
-                # Note: ST_SimplifyVW works with geometry, not geography, so we need to cast
-                from django.contrib.gis.db.models import Func
-                from django.contrib.gis.db.models.fields import GeometryField
-                from django.db.models import F
-                
-                # Create a queryset with the simplified geometry
-                # Cast geography to geometry using ::geometry, then simplify
-                simplified_path = McapLog.objects.filter(pk=mcap_log.pk).annotate(
-                    geometry_path=Func(
-                        F('lap_path'),
-                        template='%(expressions)s::geometry',
-                        output_field=GeometryField(srid=4326)
-                    ),
-                    simplified_path=Func(
-                        F('geometry_path'),
-                        tolerance,
-                        function='ST_SimplifyVW',
-                        output_field=GeometryField(srid=4326)
-                    )
-                ).first().simplified_path
-                
-                # If simplification failed or returned None, use original
-                if not simplified_path:
-                    simplified_path = lap_path
-            except Exception as e:
-                # Fallback: use original path if PostGIS function fails
-                print(f"Warning: ST_SimplifyVW failed, using original path: {e}")
-                simplified_path = lap_path
-        else:
-            # Return full unsimplified path
-            simplified_path = lap_path
-        
-        # Build GeoJSON FeatureCollection
-        import json
-        features = []
-        
-        # Add simplified path as LineString
-        if simplified_path:
-            # Convert LineString to GeoJSON format
-            coordinates = list(simplified_path.coords)
-            path_feature = {
-                'type': 'Feature',
-                'geometry': {
-                    'type': 'LineString',
-                    'coordinates': coordinates
-                },
-                'properties': {
-                    'type': 'lap_path',
-                    'id': mcap_log.id,
-                    'simplified': simplify
-                }
-            }
-            features.append(path_feature)
+        # Store a new simplification so the next request at this tolerance is a
+        # plain column read (a derived cache, so updated_at is left alone)
+        if simplify and tolerance > 0 and not mcap_log.simplified_cached:
+            McapLog.objects.filter(pk=mcap_log.pk).update(
+                simplified_geojson=path_geojson, simplified_tolerance=tolerance
+            )
         
-        # Return FeatureCollection
-        geojson_response = {
-            'type': 'FeatureCollection',
-            'features': features
-        }
+        # Build the FeatureCollection around the geometry JSON PostGIS already
+        # encoded, instead of turning every vertex into a Python tuple and back
+        properties = orjson.dumps({
+            'type': 'lap_path',
+            'id': mcap_log.id,
+            'simplified': simplify
+        })
+        content = b''.join([
+            b'{"type":"FeatureCollection","features":[{"type":"Feature","geometry":',
+            path_geojson.encode(),
+            b',"properties":',
+            properties,
+            b'}]}',
+        ])
         
-        return Response(geojson_response, status=status.HTTP_200_OK)
+        return HttpResponse(content, content_type='application/json')
     
     @action(detail=False, methods=['post'], url_path='download')
     def download(self, request):
@@ -368,6 +738,8 @@ class McapLogViewSet(viewsets.ModelViewSet):
         Accepts a POST request with a list of log IDs and optional format in the request body.
         Example: {"ids": [1, 2, 3], "format": "csv_omni"}
         Formats: "mcap" (default, original files), "csv_omni", "csv_tvn", "ld"
+        With "background": true the ZIP is built by a Celery task instead; the
+        response is 202 with a task_id and a result_url to GET the ZIP from.
         """
         serializer = DownloadRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -375,17 +747,19 @@ class McapLogViewSet(viewsets.ModelViewSet):
         log_ids = serializer.validated_data['ids']
         output_format = serializer.validated_data.get('format', 'mcap')
         
-        # Get the McapLog objects
-        mcap_logs = McapLog.objects.filter(id__in=log_ids)
+        # Load the requested rows once, with only the columns the download paths read
+        mcap_logs = list(McapLog.objects.filter(id__in=log_ids).only(
+            'id', 'file_name', 'original_uri', 'recovered_uri', 'file_size', 'updated_at'
+        ))
+        found_ids = {mcap_log.id for mcap_log in mcap_logs}
         
-        if not mcap_logs.exists():
+        if not found_ids:
             return Response(
                 {'error': 'No logs found with the provided IDs'},
                 status=status.HTTP_404_NOT_FOUND
             )
         
         # Check if all requested IDs were found
-        found_ids = set(mcap_logs.values_list('id', flat=True))
         requested_ids = set(log_ids)
         missing_ids = requested_ids - found_ids
         
@@ -395,79 +769,76 @@ class McapLogViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
         
+        # The same logs in the same format give the same ZIP: background builds
+        # reuse it from disk. No 304 here, since that isn't a valid answer to a
+        # POST; conditional requests go to the GET download-result endpoint
+        etag = _download_etag(mcap_logs, output_format)
+        
+        if serializer.validated_data.get('background'):
+            task = build_download_zip.delay(list(dict.fromkeys(log_ids)), output_format, cache_name=etag)
+            return Response(
+                {
+                    'task_id': task.id,
+                    'result_url': self.reverse_action('download-result', args=[task.id]),
+                },
+                status=status.HTTP_202_ACCEPTED
+            )
+        
+        # ZIP entries follow the order the IDs were requested in
+        position = {log_id: index for index, log_id in enumerate(log_ids)}
+        mcap_logs.sort(key=lambda mcap_log: position[mcap_log.id])
+        
         # Handle CSV/LD conversion
         if output_format.startswith('csv_') or output_format == 'ld':
-            return self._download_as_converted(mcap_logs, output_format)
+            response = self._download_as_converted(mcap_logs, output_format)
+        else:
+            # Handle MCAP download (original behavior)
+            response = self._download_as_mcap(mcap_logs)
         
-        # Handle MCAP download (original behavior)
-        return self._download_as_mcap(mcap_logs)
+        # Only complete archives are cacheable
+        if response.status_code == status.HTTP_200_OK and not response.has_header('X-Missing-Files'):
+            response['ETag'] = f'"{etag}"'
+        return response
     
     def _download_as_converted(self, mcap_logs, format):
         """
         Convert MCAP files to CSV/LD and download as ZIP.
-        Uses synchronous conversion (can be switched to async Celery if needed).
+        Conversions run in parallel on the Celery workers as one group; the
+        request waits once for the whole group.
         """
-        from .mcap_converter import McapToCsvConverter
-        from django.conf import settings
-        import datetime
-        
         conversion_results = {}
         conversion_errors = []
         
-        # Process conversions synchronously
-        for mcap_log in mcap_logs:
-            try:
-                # Determine source file path
-                file_path = None
-                
-                # Try recovered_uri first if available and not pending
-                if mcap_log.recovered_uri and mcap_log.recovered_uri != "pending":
-                    if mcap_log.recovered_uri.startswith(settings.MEDIA_URL):
-                        file_name = mcap_log.recovered_uri.replace(settings.MEDIA_URL, '', 1)
-                        file_path = Path(settings.MEDIA_ROOT) / file_name
-                    elif mcap_log.recovered_uri.startswith('/'):
-                        file_path = Path(mcap_log.recovered_uri)
-                    else:
-                        file_path = Path(settings.MEDIA_ROOT) / mcap_log.recovered_uri
-                
-                # Fall back to original_uri if recovered_uri not available
-                if not file_path or not file_path.exists():
-                    if mcap_log.original_uri:
-                        if mcap_log.original_uri.startswith(settings.MEDIA_URL):
-                            file_name = mcap_log.original_uri.replace(settings.MEDIA_URL, '', 1)
-                            file_path = Path(settings.MEDIA_ROOT) / file_name
-                        elif mcap_log.original_uri.startswith('/'):
-                            file_path = Path(mcap_log.original_uri)
-                        else:
-                            file_path = Path(settings.MEDIA_ROOT) / mcap_log.original_uri
-                
-                if not file_path or not file_path.exists():
-                    conversion_errors.append(f"{mcap_log.file_name} (ID: {mcap_log.id}) - MCAP file not found")
-                    continue
-                
-                file_path = file_path.resolve()
-                
-                # Create output directory for converted files
-                converted_dir = Path(settings.MEDIA_ROOT) / 'converted'
-                converted_dir.mkdir(parents=True, exist_ok=True)
-                
-                # Generate output filename
-                timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-                format_suffix = format.replace('csv_', '') if format.startswith('csv_') else format
-                file_extension = 'ld' if format_suffix == 'ld' else 'csv'
-                output_filename = f"{mcap_log.id}_{format_suffix}_{timestamp}.{file_extension}"
-                output_path = converted_dir / output_filename
-                
-                # Convert MCAP to CSV/LD synchronously
-                converter = McapToCsvConverter()
-                converter.convert_to_csv(str(file_path), str(output_path), format=format_suffix)
-                
-                # Return the path relative to MEDIA_ROOT
-                relative_path = output_path.relative_to(settings.MEDIA_ROOT)
-                conversion_results[mcap_log] = str(relative_path)
-                
-            except Exception as e:
-                conversion_errors.append(f"{mcap_log.file_name} (ID: {mcap_log.id}) - conversion error: {str(e)}")
+        # Fan out one conversion task per log and collect all results in a
+        # single wait (one result-backend subscription, not one .get() per task)
+        # No retries: the request only waits CONVERSION_TIMEOUT, and a retry
+        # countdown would outlast it
+        job = group(
+            convert_mcap_to_csv.s(mcap_log.id, format, retry=False) for mcap_log in mcap_logs
+        ).apply_async()
+        try:
+            results = job.join_native(timeout=CONVERSION_TIMEOUT, propagate=False)
+        except CeleryTimeoutError:
+            # Keep whatever finished in time
+            results = [
+                result.result if result.ready() else TimeoutError('conversion timed out')
+                for result in job.results
+            ]
+            # Nobody will collect the rest: stop them instead of letting them
+            # keep writing into MEDIA_ROOT/converted
+            unfinished = [result.id for result in job.results if not result.ready()]
+            if unfinished:
+                celery_app.control.revoke(unfinished, terminate=True)
+        finally:
+            job.forget()
+        
+        for mcap_log, result in zip(mcap_logs, results):
+            # The task returns the converted path relative to MEDIA_ROOT, or an
+            # error message string once it has given up
+            if isinstance(result, str) and (Path(settings.MEDIA_ROOT) / result).is_file():
+                conversion_results[mcap_log] = result
+            else:
+                conversion_errors.append(f"{mcap_log.file_name} (ID: {mcap_log.id}) - conversion error: {str(result)}")
         
         if not conversion_results:
             return Response(
@@ -487,7 +858,10 @@ class McapLogViewSet(viewsets.ModelViewSet):
         files_missing = []
         
         try:
-            with zipfile.ZipFile(temp_file_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+            # CSV compresses well even at the fastest DEFLATE level
+            with zipfile.ZipFile(
+                temp_file_path, 'w', zipfile.ZIP_DEFLATED, allowZip64=True, compresslevel=1
+            ) as zip_file:
                 for mcap_log, converted_relative_path in conversion_results.items():
                     try:
                         converted_path = Path(settings.MEDIA_ROOT) / converted_relative_path
@@ -496,13 +870,7 @@ class McapLogViewSet(viewsets.ModelViewSet):
                             files_missing.append(f"{mcap_log.file_name} (ID: {mcap_log.id}) - converted file not found at {converted_path}")
                             continue
                         
-                        # Generate output filename based on format
-                        base_name = Path(mcap_log.file_name).stem
-                        format_suffix = format.replace('csv_', '') if format.startswith('csv_') else format
-                        file_extension = 'ld' if format_suffix == 'ld' else 'csv'
-                        output_filename = f"{base_name}_{format_suffix}.{file_extension}"
-                        
-                        zip_file.write(str(converted_path), arcname=output_filename)
+                        write_to_zip(zip_file, converted_path, converted_arcname(mcap_log.file_name, format))
                         files_added += 1
                     except Exception as file_error:
                         files_missing.append(f"{mcap_log.file_name} (ID: {mcap_log.id}) - error: {str(file_error)}")
@@ -524,16 +892,8 @@ class McapLogViewSet(viewsets.ModelViewSet):
             format_display = format.replace('csv_', '') if format.startswith('csv_') else format
             zip_filename = f'mcap_logs_{format_display}_{timestamp}.zip'
             
-            # Read ZIP content
-            with open(temp_file_path, 'rb') as zip_file:
-                zip_content = zip_file.read()
-            
-            os.unlink(temp_file_path)
-            
-            # Create response
-            response = HttpResponse(zip_content, content_type='application/zip')
-            response['Content-Disposition'] = f'attachment; filename="{zip_filename}"'
-            response['Content-Length'] = len(zip_content)
+            # Stream the ZIP from disk; the temp file is deleted once it has been sent
+            response = _zip_file_response(temp_file_path, zip_filename)
             
             if files_missing or conversion_errors:
                 error_info = []
@@ -552,7 +912,6 @@ class McapLogViewSet(viewsets.ModelViewSet):
                 except:
                     pass
             
-            import traceback
             error_details = traceback.format_exc()
             print(f"CSV download error: {str(e)}\n{error_details}")
             
@@ -564,60 +923,53 @@ class McapLogViewSet(viewsets.ModelViewSet):
     def _download_as_mcap(self, mcap_logs):
         """
         Download original MCAP files as ZIP (original behavior).
+        Small batches are built in memory; larger ones go through a temp file.
         """
-        # Create a temporary file for the ZIP
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.zip')
-        temp_file_path = temp_file.name
-        temp_file.close()
+        # Use the stored file_size to decide without stat'ing every file
+        file_sizes = [mcap_log.file_size for mcap_log in mcap_logs]
+        in_memory = (
+            all(size is not None for size in file_sizes)
+            and sum(file_sizes) < IN_MEMORY_ZIP_MAX_BYTES
+        )
+        
+        if in_memory:
+            zip_target = io.BytesIO()
+        else:
+            # Create a temporary file for the ZIP
+            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.zip')
+            temp_file_path = temp_file.name
+            temp_file.close()
+            zip_target = temp_file_path
         
         files_added = 0
         files_missing = []
         
         try:
             # Create ZIP file
-            with zipfile.ZipFile(temp_file_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+            # MCAP chunks are already LZ4/Zstd-compressed, so store them as-is
+            with zipfile.ZipFile(zip_target, 'w', zipfile.ZIP_STORED, allowZip64=True) as zip_file:
                 for mcap_log in mcap_logs:
+                    file_path = original_file_path(mcap_log)
+                    if file_path is None:
+                        files_missing.append(f"{mcap_log.file_name} (ID: {mcap_log.id}) - no file in the media directory")
+                        continue
                     try:
-                        if not mcap_log.original_uri:
-                            files_missing.append(f"{mcap_log.file_name} (ID: {mcap_log.id}) - no file URI")
-                            continue
-                        
-                        # Extract file path from original_uri
-                        # original_uri format: /media/mcap_logs/filename.mcap
-                        if mcap_log.original_uri.startswith(settings.MEDIA_URL):
-                            file_name = mcap_log.original_uri.replace(settings.MEDIA_URL, '', 1)  # Only replace first occurrence
-                            file_path = Path(settings.MEDIA_ROOT) / file_name
-                        elif mcap_log.original_uri.startswith('/'):
-                            # Handle absolute paths starting with /
-                            file_path = Path(mcap_log.original_uri)
-                        else:
-                            # Handle relative paths or other formats
-                            file_path = Path(settings.MEDIA_ROOT) / mcap_log.original_uri
-                        
-                        # Resolve the path to handle any symlinks or relative paths
-                        file_path = file_path.resolve()
-                        
-                        # Check if file exists
-                        if not file_path.exists():
-                            files_missing.append(f"{mcap_log.file_name} (ID: {mcap_log.id}) - file not found at {file_path}")
-                            continue
-                        
-                        # Check if it's actually a file (not a directory)
-                        if not file_path.is_file():
-                            files_missing.append(f"{mcap_log.file_name} (ID: {mcap_log.id}) - path is not a file")
-                            continue
-                        
-                        # Add file to ZIP with original filename
-                        zip_file.write(str(file_path), arcname=mcap_log.file_name)
+                        # Add file to ZIP with original filename; opening it is
+                        # the existence check
+                        write_to_zip(zip_file, file_path, mcap_log.file_name)
                         files_added += 1
+                    except FileNotFoundError:
+                        files_missing.append(f"{mcap_log.file_name} (ID: {mcap_log.id}) - file not found at {file_path}")
+                    except IsADirectoryError:
+                        files_missing.append(f"{mcap_log.file_name} (ID: {mcap_log.id}) - path is not a file")
                     except Exception as file_error:
                         # Handle individual file errors gracefully
                         files_missing.append(f"{mcap_log.file_name} (ID: {mcap_log.id}) - error: {str(file_error)}")
-                        continue
             
             # If no files were added, return error
             if files_added == 0:
-                os.unlink(temp_file_path)
+                if not in_memory:
+                    os.unlink(temp_file_path)
                 return Response(
                     {
                         'error': 'No files could be added to the ZIP archive',
@@ -630,18 +982,16 @@ class McapLogViewSet(viewsets.ModelViewSet):
             timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
             zip_filename = f'mcap_logs_{timestamp}.zip'
             
-            # Read the ZIP file into memory for response
-            # This ensures proper cleanup of the temp file
-            with open(temp_file_path, 'rb') as zip_file:
-                zip_content = zip_file.read()
-            
-            # Delete temp file now that we have the content
-            os.unlink(temp_file_path)
-            
-            # Create response with the ZIP content
-            response = HttpResponse(zip_content, content_type='application/zip')
-            response['Content-Disposition'] = f'attachment; filename="{zip_filename}"'
-            response['Content-Length'] = len(zip_content)
+            if in_memory:
+                # Create response with the ZIP content
+                zip_content = zip_target.getvalue()
+                response = HttpResponse(zip_content, content_type='application/zip')
+                response['Content-Disposition'] = f'attachment; filename="{zip_filename}"'
+                response['Content-Length'] = len(zip_content)
+            else:
+                # Stream the ZIP from disk instead of reading it into memory;
+                # the temp file is deleted once it has been sent
+                response = _zip_file_response(temp_file_path, zip_filename)
             
             # Add info about missing files in response headers if any
             if files_missing:
@@ -658,7 +1008,6 @@ class McapLogViewSet(viewsets.ModelViewSet):
                     pass
             
             # Log the full error for debugging
-            import traceback
             error_details = traceback.format_exc()
             print(f"Download error: {str(e)}\n{error_details}")
             
@@ -667,6 +1016,66 @@ class McapLogViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     
+    @action(detail=False, methods=['get'], url_path=r'download/(?P<task_id>[^/.]+)', url_name='download-result')
+    def download_result(self, request, task_id=None):
+        """
+        Fetch a ZIP built by a background download (POST download/ with "background": true).
+        Returns 202 while the task is running, then the ZIP itself (304 if the
+        client's If-None-Match already has it). With DOWNLOADS_ACCEL_REDIRECT_PREFIX
+        set, nginx serves the file. Archives stay on disk for DOWNLOADS_MAX_AGE.
+        """
+        task = AsyncResult(task_id, app=celery_app)
+        
+        if not task.ready():
+            return Response(
+                {'task_id': task_id, 'status': task.state},
+                status=status.HTTP_202_ACCEPTED
+            )
+        
+        if task.failed():
+            return Response(
+                {'task_id': task_id, 'error': str(task.result)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        
+        result = task.result
+        # Any task id fits the URL; only build_download_zip results describe a ZIP
+        if not isinstance(result, dict) or 'file' not in result:
+            return Response(
+                {'error': f'No download found for task {task_id}'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        zip_path = Path(settings.MEDIA_ROOT) / result['file'] if result['file'] else None
+        if not zip_path or not zip_path.is_file():
+            return Response(
+                {
+                    'error': 'No files could be added to the ZIP archive',
+                    'missing_files': result.get('missing', [])
+                },
+                status=status.HTTP_404_NOT_FOUND if result['file'] else status.HTTP_400_BAD_REQUEST
+            )
+        
+        etag = result.get('etag')
+        if etag and _etag_matches(request, etag):
+            return HttpResponse(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': f'"{etag}"'})
+        
+        zip_filename = f'mcap_logs_{task_id}.zip'
+        if settings.DOWNLOADS_ACCEL_REDIRECT_PREFIX:
+            # Let nginx send the file; no Python in the byte path
+            response = HttpResponse(content_type='application/zip')
+            response['X-Accel-Redirect'] = f'{settings.DOWNLOADS_ACCEL_REDIRECT_PREFIX}{zip_path.name}'
+            response['Content-Disposition'] = f'attachment; filename="{zip_filename}"'
+        else:
+            # Keep the file: later downloads of the same logs reuse it
+            response = _zip_file_response(zip_path, zip_filename, delete=False)
+        if etag:
+            response['ETag'] = f'"{etag}"'
+        if result['missing']:
+            response['X-Missing-Files'] = ', '.join(result['missing'])
+        
+        return response
+    
     @action(detail=True, methods=['get'], url_path='job-status')
     def job_status(self, request, pk=None):
         """
@@ -685,20 +1094,9 @@ class McapLogViewSet(viewsets.ModelViewSet):
         # If there's a task ID, get detailed Celery task status
         if mcap_log.parse_task_id:
             try:
-                task_result = AsyncResult(mcap_log.parse_task_id)
-                response_data['task_state'] = task_result.state
-                response_data['task_info'] = {
-                    'ready': task_result.ready(),
-                    'successful': task_result.successful() if task_result.ready() else None,
-                    'failed': task_result.failed() if task_result.ready() else None,
-                }
-                
-                # Add result or error if available
-                if task_result.ready():
-                    if task_result.successful():
-                        response_data['task_info']['result'] = task_result.result
-                    elif task_result.failed():
-                        response_data['task_info']['error'] = str(task_result.info)
+                task_state, task_info = _task_status(mcap_log.parse_task_id)
+                response_data['task_state'] = task_state
+                response_data['task_info'] = task_info
             except Exception as e:
                 response_data['task_info'] = {'error': f'Could not fetch task status: {str(e)}'}
         else:
@@ -723,121 +1121,238 @@ class McapLogViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        results = []
+        # Created at startup by ApiConfig.ready()
         media_dir = settings.MEDIA_ROOT / 'mcap_logs'
-        media_dir.mkdir(parents=True, exist_ok=True)
         
-        for uploaded_file in uploaded_files:
+        def _ingest(uploaded_file):
+            """
+            Write one uploaded file to disk and build its (unsaved) McapLog.
+            Runs in a worker thread, so it must not touch the database.
+            """
+            # Generate unique filename (a timestamp prefix could collide between
+            # files saved concurrently by the worker threads)
+            file_name = f"{uuid.uuid4().hex}_{uploaded_file.name}"
+            file_path = media_dir / file_name
+            
+            # Save the uploaded file
+            _save_uploaded_file(uploaded_file, file_path)
+            
+            saved_file_relpath = str(file_path.relative_to(settings.MEDIA_ROOT))
+            
+            # File size is already known from the upload, no need to stat
+            file_size = uploaded_file.size
+            
+            mcap_log = McapLog(
+                file_name=uploaded_file.name,
+                original_uri=f"{settings.MEDIA_URL}mcap_logs/{file_name}",
+                file_size=file_size,
+                file_sha256=getattr(uploaded_file, 'sha256', None),
+                parse_status="pending",
+                recovery_status="pending",
+            )
+            return mcap_log, saved_file_relpath
+        
+        def _error_result(uploaded_file, error):
+            return {
+                'file_name': uploaded_file.name,
+                'error': str(error),
+                'parse_status': 'error'
+            }
+        
+        # Results keep the order the files were uploaded in
+        results = [None] * len(uploaded_files)
+        ingested = []
+        
+        # Disk writes are I/O-bound, so save the files concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(uploaded_files))) as executor:
+            futures = {
+                executor.submit(_ingest, uploaded_file): index
+                for index, uploaded_file in enumerate(uploaded_files)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    mcap_log, saved_file_relpath = future.result()
+                    ingested.append((index, mcap_log, saved_file_relpath))
+                except Exception as e:
+                    # If one file fails, continue with others
+                    results[index] = _error_result(uploaded_files[index], e)
+        
+        ingested.sort(key=lambda item: item[0])
+        
+        if ingested:
+            # Pre-assign the recovery task IDs so a single INSERT stores every row
+            # complete, with no per-row UPDATE for parse_task_id afterwards
+            for _, mcap_log, _ in ingested:
+                mcap_log.parse_task_id = celery_uuid()
+            
+            # Create all database records with a single INSERT
+            # (bulk_create runs in its own transaction)
             try:
-                # Generate unique filename
-                timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S_%f')
-                file_name = f"{timestamp}_{uploaded_file.name}"
-                file_path = media_dir / file_name
-                
-                # Save the uploaded file
-                with open(file_path, 'wb+') as destination:
-                    for chunk in uploaded_file.chunks():
-                        destination.write(chunk)
-                
-                saved_file_relpath = str(file_path.relative_to(settings.MEDIA_ROOT))
-                
-                # Calculate file size
-                file_size = file_path.stat().st_size
-                
-                # Create database record
-                mcap_log = McapLog.objects.create(
-                    file_name=uploaded_file.name,
-                    original_uri=f"{settings.MEDIA_URL}mcap_logs/{file_name}",
-                    file_size=file_size,
-                    parse_status="pending",
-                    recovery_status="pending",
-                )
-                
-                # Trigger recovery (which will trigger parsing when done)
-                recovery_task = recover_mcap_file.delay(mcap_log.id, saved_file_relpath)
-                mcap_log.parse_task_id = recovery_task.id
-                mcap_log.save(update_fields=['parse_task_id'])
-                
-                # Serialize the result
-                serializer = self.get_serializer(mcap_log)
-                results.append(serializer.data)
-                
+                McapLog.objects.bulk_create([mcap_log for _, mcap_log, _ in ingested])
+                bump_mcap_log_version()
             except Exception as e:
-                # If one file fails, continue with others
-                results.append({
-                    'file_name': uploaded_file.name if uploaded_file else 'unknown',
-                    'error': str(e),
-                    'parse_status': 'error'
-                })
-        
-        return Response({
-            'count': len(results),
-            'results': results
-        }, status=status.HTTP_201_CREATED)
+                for index, _, _ in ingested:
+                    results[index] = _error_result(uploaded_files[index], e)
+                ingested = []
+        
+        # Rows are committed now, so workers can always see them.
+        # Publish every task through one pooled producer (one broker connection/channel).
+        with celery_app.producer_or_acquire() as producer:
+            for index, mcap_log, saved_file_relpath in ingested:
+                try:
+                    # Trigger recovery (which will trigger parsing when done)
+                    recover_mcap_file.apply_async(
+                        args=(mcap_log.id, saved_file_relpath),
+                        task_id=mcap_log.parse_task_id,
+                        producer=producer,
+                    )
+                except Exception as e:
+                    results[index] = _error_result(uploaded_files[index], e)
+                    continue
+                
+                # Same fields as McapLogSerializer, read straight off the instance:
+                # a fresh upload has no relations or lap_path yet, so every value
+                # is a plain one
+                results[index] = {
+                    name: getattr(mcap_log, name) for name in _mcap_log_output_fields()
+                }
+        
+        # Encode with orjson (the results are plain dicts/lists). OPT_UTC_Z writes
+        # UTC datetimes with a 'Z' suffix, as DRF renders them elsewhere.
+        return HttpResponse(
+            orjson.dumps({'count': len(results), 'results': results}, option=orjson.OPT_UTC_Z),
+            content_type='application/json',
+            status=status.HTTP_201_CREATED,
+        )
     
     @action(detail=False, methods=['get'], url_path='job-statuses')
     def job_statuses(self, request):
         """
-        Get parsing job statuses for all MCAP logs.
+        Get parsing job statuses for MCAP logs, newest first.
         Optionally filter by parse_status query parameter.
+        Results are cursor-paginated (page_size, default 50, max 200); follow
+        the 'next' link for older logs.
         """
-        queryset = McapLog.objects.all()
-        
         # Filter by status if provided
         status_filter = request.query_params.get('status', None)
+        
+        # Polls within the TTL share one cached response. The key includes the
+        # McapLog version, bumped on every write, so stale DB data is never served.
+        cache_key = f"job_statuses:{request.query_params.urlencode()}:{mcap_log_version()}"
+        # The encoded body is cached, so a hit skips serialization entirely
+        content = cache.get(cache_key)
+        if content is not None:
+            return HttpResponse(content, content_type='application/json')
+        
+        queryset = McapLog.objects.all()
+        
         if status_filter:
             if status_filter.startswith('error'):
                 # Match any error status
-                queryset = queryset.filter(parse_status__startswith='error')
+                queryset = queryset.filter(parse_status_category='error')
             else:
                 queryset = queryset.filter(parse_status=status_filter)
         
-        # Order by created_at descending (newest first)
-        queryset = queryset.order_by('-created_at')
+        # Fetch plain dict rows with only the columns this endpoint reports
+        # (the paginator orders by created_at descending, newest first)
+        queryset = queryset.values(
+            'id', 'file_name', 'parse_status', 'parse_task_id', 'created_at'
+        )
+        
+        # Only the current page is fetched; its task states come from one
+        # result-backend round-trip
+        paginator = JobStatusPagination()
+        try:
+            rows = paginator.paginate_queryset(queryset, request, view=self)
+        except NotFound:
+            # Invalid cursor: let DRF return its 404
+            raise
+        except Exception as e:
+            logger.error("Error building job statuses: %s", e)
+            return Response(
+                {'error': f'Failed to fetch job statuses: {str(e)}'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        
+        task_states = {}
+        task_states_error = None
+        try:
+            task_states = _fetch_task_states(
+                row['parse_task_id'] for row in rows if row['parse_task_id']
+            )
+        except Exception as e:
+            task_states_error = str(e)
         
-        # Build response with job statuses
         results = []
-        for mcap_log in queryset:
-            try:
-                job_data = {
-                    'log_id': mcap_log.id,
-                    'file_name': mcap_log.file_name,
-                    'parse_status': mcap_log.parse_status,
-                    'parse_task_id': mcap_log.parse_task_id,
-                    'created_at': mcap_log.created_at.isoformat() if mcap_log.created_at else None,
-                }
-                
-                # Get Celery task status if task ID exists
-                if mcap_log.parse_task_id:
-                    try:
-                        task_result = AsyncResult(mcap_log.parse_task_id)
-                        job_data['task_state'] = task_result.state
-                        job_data['task_ready'] = task_result.ready()
-                    except Exception as e:
-                        # If we can't get task status, still include the record
-                        job_data['task_state'] = 'UNKNOWN'
-                        job_data['task_error'] = str(e)
-                else:
-                    job_data['task_state'] = None
-                
-                results.append(job_data)
-            except Exception as e:
-                # If there's an error processing a single record, log it but continue
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.error(f"Error processing log {mcap_log.id}: {str(e)}")
-                # Still add a basic record
-                results.append({
-                    'log_id': mcap_log.id,
-                    'file_name': getattr(mcap_log, 'file_name', 'unknown'),
-                    'parse_status': getattr(mcap_log, 'parse_status', 'unknown'),
-                    'error': str(e)
-                })
-        
-        return Response({
-            'count': len(results),
-            'results': results
-        }, status=status.HTTP_200_OK)
+        for row in rows:
+            task_id = row['parse_task_id']
+            job_data = {
+                'log_id': row['id'],
+                'file_name': row['file_name'],
+                'parse_status': row['parse_status'],
+                'parse_task_id': task_id,
+                # orjson emits datetimes as RFC 3339 strings
+                'created_at': row['created_at'],
+            }
+            
+            # Get Celery task status if task ID exists
+            if not task_id:
+                job_data['task_state'] = None
+            elif task_states_error is None:
+                task_state = task_states[task_id]
+                job_data['task_state'] = task_state
+                job_data['task_ready'] = task_state in celery_states.READY_STATES
+            else:
+                # If we can't get task status, still include the record
+                job_data['task_state'] = 'UNKNOWN'
+                job_data['task_error'] = task_states_error
+            
+            results.append(job_data)
+        
+        # Hot polling endpoint: encode with orjson and skip DRF's renderer and
+        # content negotiation
+        content = orjson.dumps(paginator.get_paginated_data(results))
+        cache.set(cache_key, content, timeout=JOB_STATUSES_CACHE_TTL)
+        
+        return HttpResponse(content, content_type='application/json')
+
+
+def status_events(request):
+    """
+    Server-Sent Events stream of MCAP log status changes.
+    Each event's data is the JSON message published by the Celery tasks, e.g.
+    {"log_id": 12, "parse_status": "completed"}. Clients subscribe once instead of
+    polling job-statuses; use job-statuses for the initial state on page load.
+    
+    Every open stream occupies one web worker thread for as long as it is open,
+    so a stream is closed after STATUS_EVENTS_MAX_AGE seconds. EventSource then
+    reconnects after STATUS_EVENTS_RETRY_MS; clients should refetch the state
+    they track when the connection (re)opens, since events sent in between are lost.
+    """
+    def event_stream():
+        pubsub = get_redis().pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(STATUS_CHANNEL)
+        deadline = time.monotonic() + STATUS_EVENTS_MAX_AGE
+        try:
+            yield f'retry: {STATUS_EVENTS_RETRY_MS}\n\n'
+            while time.monotonic() < deadline:
+                message = pubsub.get_message(timeout=STATUS_EVENTS_KEEPALIVE)
+                if message is None:
+                    # Comment line keeps proxies from closing an idle connection
+                    yield ': keepalive\n\n'
+                    continue
+                data = message['data']
+                if isinstance(data, bytes):
+                    data = data.decode()
+                yield f'data: {data}\n\n'
+        finally:
+            pubsub.close()
+
+    response = StreamingHttpResponse(event_stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
 
 
 class ParseSummaryView(APIView):
@@ -845,19 +1360,87 @@ class ParseSummaryView(APIView):
         """
         Parse MCAP file summary without creating a database record.
         Returns channel information, timestamps, and duration.
+        Parsing runs on a Celery worker so large files don't tie up the web worker:
+        by default the response is 202 with a task_id to poll via
+        GET parse/summary/<task_id>/. Pass ?sync=true to wait for the result instead.
         """
         serializer = ParseSummaryRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         path = serializer.validated_data["path"]
 
-        # Call your existing parsing function here:
-        result = Parser.parse_stuff(path)  # your Python parser returning a dict
+        # Summaries are a pure function of the file, so serve repeats from the cache
+        cache_key = _parse_summary_cache_key(path)
+        if cache_key:
+            result = cache.get(cache_key)
+            if result is not None:
+                return Response(result, status=status.HTTP_200_OK)
+
+        task = parse_summary.delay(path, cache_key)
+
+        if request.query_params.get('sync', 'false').lower() == 'true':
+            try:
+                result = task.get(timeout=PARSE_SUMMARY_SYNC_TIMEOUT, propagate=True)
+            except CeleryTimeoutError:
+                return Response(
+                    {'task_id': task.id, 'error': 'Parsing is still running, poll the task instead'},
+                    status=status.HTTP_202_ACCEPTED
+                )
+            return Response(result, status=status.HTTP_200_OK)
+
+        return Response({'task_id': task.id}, status=status.HTTP_202_ACCEPTED)
+
+
+class ParseSummaryResultView(APIView):
+    def get(self, request, task_id):
+        """
+        Get the result of a parse summary task started by ParseSummaryView.
+        Returns 202 while the task is still running.
+        """
+        task_result = AsyncResult(task_id, app=celery_app)
+        response_data = {
+            'task_id': task_id,
+            'task_state': task_result.state,
+        }
+
+        if not task_result.ready():
+            return Response(response_data, status=status.HTTP_202_ACCEPTED)
+
+        if task_result.successful():
+            response_data['result'] = task_result.result
+            return Response(response_data, status=status.HTTP_200_OK)
+
+        response_data['error'] = str(task_result.info)
+        return Response(response_data, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class CachedListMixin:
+    """
+    Caches the plain (no query parameters) list response of a read-only lookup viewset.
+    The cache entry is dropped by api.signals whenever a row of the model changes.
+    Responses carry an ETag, so a client re-sending it gets a 304 with no body.
+    """
+    def list(self, request, *args, **kwargs):
+        if request.query_params:
+            return super().list(request, *args, **kwargs)
+
+        cache_key = list_cache_key(self.queryset.model)
+        cached = cache.get(cache_key)
+        if cached is None:
+            data = super().list(request, *args, **kwargs).data
+            etag = hashlib.sha256(orjson.dumps(data)).hexdigest()
+            cache.set(cache_key, (etag, data), timeout=LOOKUP_LIST_CACHE_TTL)
+        else:
+            etag, data = cached
 
-        return Response(result, status=status.HTTP_200_OK)
+        # no-cache: clients keep the list but revalidate it, so a new row shows up at once
+        headers = {'ETag': f'"{etag}"', 'Cache-Control': 'no-cache'}
+        if _etag_matches(request, etag):
+            return HttpResponse(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(data, headers=headers)
 
 
-class CarViewSet(viewsets.ReadOnlyModelViewSet):
+class CarViewSet(CachedListMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for viewing Car instances.
     Provides list and detail views for dropdown population.
@@ -866,7 +1449,7 @@ class CarViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = CarSerializer
 
 
-class DriverViewSet(viewsets.ReadOnlyModelViewSet):
+class DriverViewSet(CachedListMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for viewing Driver instances.
     Provides list and detail views for dropdown population.
@@ -875,7 +1458,7 @@ class DriverViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = DriverSerializer
 
 
-class EventTypeViewSet(viewsets.ReadOnlyModelViewSet):
+class EventTypeViewSet(CachedListMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for viewing EventType instances.
     Provides list and detail views for dropdown population.
@@ -4,6 +4,17 @@ Celery configuration for the backend project.
 import os
 from celery import Celery
 
+# Workers started with `-P gevent` are monkey-patched before this module is
+# imported. Make psycopg2 cooperative as well, so a DB query yields to other
+# greenlets instead of blocking the whole worker.
+try:
+    from gevent import monkey
+except ImportError:
+    monkey = None
+if monkey is not None and monkey.is_module_patched('socket'):
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
+
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
 
@@ -164,6 +164,24 @@ STATIC_URL = 'static/'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = Path(os.environ.get('MEDIA_ROOT', '/Users/pettruskonnoth/Documents'))
 
+# Uploads up to this size stay in memory; larger ones are spooled to a temp file
+# that is then moved (not copied) into MEDIA_ROOT
+FILE_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10 MB
+
+# Same as Django's defaults, but each upload also gets a SHA-256 computed as it streams in
+FILE_UPLOAD_HANDLERS = [
+    'api.upload_handlers.Sha256MemoryFileUploadHandler',
+    'api.upload_handlers.Sha256TemporaryFileUploadHandler',
+]
+
+# When set (e.g. '/protected/downloads/'), background download ZIPs are handed to
+# nginx with X-Accel-Redirect to this internal location, which must alias
+# MEDIA_ROOT/downloads/. Unset: Django streams the file itself.
+DOWNLOADS_ACCEL_REDIRECT_PREFIX = os.environ.get('DOWNLOADS_ACCEL_REDIRECT_PREFIX')
+
+# Background download ZIPs older than this many seconds are removed
+DOWNLOADS_MAX_AGE = 24 * 60 * 60
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -199,6 +217,8 @@ SWAGGER_SETTINGS = {
         }
     },
     'USE_SESSION_AUTH': False,
+    # Build the schema once per process instead of on every docs request
+    'DEFAULT_GENERATOR_CLASS': 'api.schema.CachedSchemaGenerator',
 }
 
 REDOC_SETTINGS = {
@@ -207,14 +227,25 @@ REDOC_SETTINGS = {
 
 # Django REST Framework settings
 REST_FRAMEWORK = {
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.BoundedPageNumberPagination',
     'PAGE_SIZE': 10,  # Number of items per page
 }
 
+# Cache (Redis, shared by all web workers)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ.get('CACHE_URL', 'redis://localhost:6379/1'),
+    }
+}
+
 # Celery Configuration
 CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', 'redis://localhost:6379/0')
 CELERY_RESULT_BACKEND = os.environ.get('CELERY_RESULT_BACKEND', 'redis://localhost:6379/0')
 
+# Redis used for live status events (pub/sub channels are shared across databases)
+STATUS_EVENTS_REDIS_URL = os.environ.get('STATUS_EVENTS_REDIS_URL', CELERY_BROKER_URL)
+
 # Celery task settings
 CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
@@ -226,3 +257,12 @@ CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_TIME_LIMIT = 30 * 60  # 30 minutes
 CELERY_TASK_SOFT_TIME_LIMIT = 25 * 60  # 25 minutes
 CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+
+# Recovery mostly waits (on the mcap CLI subprocess, file copies, DB writes), so it
+# runs on its own 'io' queue served by a gevent worker. Each recovery still runs
+# a CPU/disk-heavy subprocess, so that worker's concurrency is kept to 2x cores.
+# Parsing is CPU-bound protobuf decoding and stays on the default queue with a
+# prefork worker.
+CELERY_TASK_ROUTES = {
+    'api.tasks.recover_mcap_file': {'queue': 'io'},
+}
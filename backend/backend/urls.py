@@ -5,9 +5,11 @@ from rest_framework.routers import DefaultRouter
 from api.views import (
     McapLogViewSet, 
     ParseSummaryView,
+    ParseSummaryResultView,
     CarViewSet,
     DriverViewSet,
-    EventTypeViewSet
+    EventTypeViewSet,
+    status_events,
 )
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
@@ -24,6 +26,7 @@ router = DefaultRouter()
 # - GET /api/mcap-logs/{id}/geojson/ (custom action)
 # - GET /api/mcap-logs/{id}/job-status/ (custom action)
 # - POST /api/mcap-logs/download/ (custom action)
+# - GET /api/mcap-logs/download/{task_id}/ (custom action, background download result)
 # - POST /api/mcap-logs/batch-upload/ (custom action)
 # - GET /api/mcap-logs/job-statuses/ (custom action)
 router.register(r'mcap-logs', McapLogViewSet)
@@ -43,6 +46,9 @@ router.register(r'drivers', DriverViewSet, basename='driver')
 # - GET /api/event-types/{id}/ (retrieve)
 router.register(r'event-types', EventTypeViewSet, basename='event-type')
 
+# Build the router's URL patterns once; both prefixes below include the same list
+router_urls = router.urls
+
 # ===== API DOCUMENTATION =====
 # Swagger/OpenAPI schema view
 schema_view = get_schema_view(
@@ -57,20 +63,29 @@ schema_view = get_schema_view(
     public=True,
 )
 
+# Rendered docs responses are cached (in the shared Redis cache) for an hour.
+# Not in DEBUG, where the schema changes with every code edit.
+SCHEMA_CACHE_TIMEOUT = 0 if settings.DEBUG else 60 * 60
+SCHEMA_CACHE_KWARGS = {'key_prefix': 'swagger'}
+
 # ===== URL PATTERNS =====
 urlpatterns = [
     # API documentation endpoints
-    re_path(r'^swagger(?P<format>\.json|\.yaml)$', schema_view.without_ui(cache_timeout=0), name='schema-json'),
-    re_path(r'^swagger/$', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
-    re_path(r'^redoc/$', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
+    re_path(r'^swagger(?P<format>\.json|\.yaml)$', schema_view.without_ui(cache_timeout=SCHEMA_CACHE_TIMEOUT, cache_kwargs=SCHEMA_CACHE_KWARGS), name='schema-json'),
+    re_path(r'^swagger/$', schema_view.with_ui('swagger', cache_timeout=SCHEMA_CACHE_TIMEOUT, cache_kwargs=SCHEMA_CACHE_KWARGS), name='schema-swagger-ui'),
+    re_path(r'^redoc/$', schema_view.with_ui('redoc', cache_timeout=SCHEMA_CACHE_TIMEOUT, cache_kwargs=SCHEMA_CACHE_KWARGS), name='schema-redoc'),
     
     # API routes with /api/ prefix (recommended)
-    path('api/', include(router.urls)),
+    path('api/', include(router_urls)),
     path("api/parse/summary/", ParseSummaryView.as_view(), name="parse-summary"),
+    path("api/parse/summary/<str:task_id>/", ParseSummaryResultView.as_view(), name="parse-summary-result"),
+    path("api/status-events/", status_events, name="status-events"),
     
     # Root-level routes (for backward compatibility)
-    path('', include(router.urls)),
+    path('', include(router_urls)),
     path("parse/summary/", ParseSummaryView.as_view(), name="parse-summary-root"),
+    path("parse/summary/<str:task_id>/", ParseSummaryResultView.as_view(), name="parse-summary-result-root"),
+    path("status-events/", status_events, name="status-events-root"),
 ]
 
 # Serve media files in development
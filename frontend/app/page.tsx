@@ -1,6 +1,6 @@
 'use client';
 
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import dynamic from 'next/dynamic';
 import 'leaflet/dist/leaflet.css';
 import { Button } from '@/components/ui/button';
@@ -345,6 +345,8 @@ export default function Home() {
   const [error, setError] = useState<string | null>(null);
   const [selectedFiles, setSelectedFiles] = useState<File[]>([]);
   const [processingLogIds, setProcessingLogIds] = useState<number[]>([]);
+  // Latest processingLogIds for the long-lived status event handlers
+  const processingLogIdsRef = useRef<number[]>([]);
   const [totalCount, setTotalCount] = useState(0);
   const [currentPage, setCurrentPage] = useState(1);
   const pageSize = 10; // matches backend REST_FRAMEWORK['PAGE_SIZE']
@@ -503,6 +505,8 @@ export default function Home() {
         payload?.results?.map((r: any) => r?.id).filter((id: any) => typeof id === 'number') ?? [];
 
       if (createdIds.length > 0) {
+        // Update the ref right away so status events arriving before the next render count
+        processingLogIdsRef.current = Array.from(new Set([...processingLogIdsRef.current, ...createdIds]));
         setProcessingLogIds((prev) => Array.from(new Set([...prev, ...createdIds])));
       }
 
@@ -511,6 +515,9 @@ export default function Home() {
       setSelectedFiles([]);
       setCurrentPage(1);
       await fetchLogs(1, debouncedSearchQuery);
+
+      // Catch up on any status events sent before the new IDs were tracked
+      await refreshProcessingLogs(createdIds);
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Failed to upload file');
       console.error('Error uploading file:', err);
@@ -877,51 +884,75 @@ export default function Home() {
     return v === 'completed' || v === 'success' || v.startsWith('error');
   };
 
-  // Poll for status updates while uploads are processing
   useEffect(() => {
-    if (processingLogIds.length === 0) return;
+    processingLogIdsRef.current = processingLogIds;
+  }, [processingLogIds]);
 
-    let cancelled = false;
-    const interval = setInterval(async () => {
-      try {
-        const ids = processingLogIds.slice();
-        if (ids.length === 0) return;
-
-        const results = await Promise.all(
-          ids.map(async (id) => {
-            const res = await fetch(`${API_BASE_URL}/mcap-logs/${id}/`);
-            if (!res.ok) return { id, log: null };
-            const log = await res.json();
-            return { id, log };
-          })
-        );
+  // Refetch the given logs, update their rows and stop tracking finished ones
+  const refreshProcessingLogs = async (ids: number[]) => {
+    if (ids.length === 0) return;
+    try {
+      const results = await Promise.all(
+        ids.map(async (id) => {
+          const res = await fetch(`${API_BASE_URL}/mcap-logs/${id}/`);
+          if (!res.ok) return { id, log: null };
+          const log = await res.json();
+          return { id, log };
+        })
+      );
 
-        if (cancelled) return;
+      // Update visible rows in-place if they're on the current page
+      setLogs((prev) => {
+        const byId = new Map(results.filter((r) => r.log).map((r) => [r.id, r.log]));
+        return prev.map((l) => (byId.has(l.id) ? { ...l, ...byId.get(l.id) } : l));
+      });
 
-        // Update visible rows in-place if they’re on the current page
-        setLogs((prev) => {
-          const byId = new Map(results.filter((r) => r.log).map((r) => [r.id, r.log]));
-          return prev.map((l) => (byId.has(l.id) ? { ...l, ...byId.get(l.id) } : l));
-        });
+      // Remove finished IDs
+      const finished = results
+        .filter((r) => r.log && terminalStatus(r.log.recovery_status) && terminalStatus(r.log.parse_status))
+        .map((r) => r.id);
+      if (finished.length > 0) {
+        processingLogIdsRef.current = processingLogIdsRef.current.filter((id) => !finished.includes(id));
+        setProcessingLogIds((prev) => prev.filter((id) => !finished.includes(id)));
+      }
+    } catch (_) {
+      // Transient errors are fine; the next event or poll retries
+    }
+  };
 
-        // Remove finished IDs
-        setProcessingLogIds((prev) =>
-          prev.filter((id) => {
-            const found = results.find((r) => r.id === id)?.log;
-            if (!found) return true;
-            return !(terminalStatus(found.recovery_status) && terminalStatus(found.parse_status));
-          })
-        );
+  // One status event stream for the page's lifetime. Events are matched against
+  // the ref, so tracking new uploads doesn't reconnect (and drop events).
+  useEffect(() => {
+    const events = new EventSource(`${API_BASE_URL}/status-events/`);
+
+    // (Re)connected: events sent while disconnected are lost, so resync
+    events.onopen = () => {
+      refreshProcessingLogs(processingLogIdsRef.current);
+    };
+
+    events.onmessage = (event) => {
+      try {
+        const { log_id: id } = JSON.parse(event.data);
+        if (!processingLogIdsRef.current.includes(id)) return;
+
+        // Status changed: refetch the log once to pick up parsed fields
+        refreshProcessingLogs([id]);
       } catch (_) {
-        // Keep polling; transient errors are fine
+        // Ignore malformed events; EventSource reconnects on its own after errors
       }
-    }, 2500);
+    };
+
+    // Slow fallback poll in case events are missed (e.g. Redis unavailable)
+    const interval = setInterval(() => {
+      refreshProcessingLogs(processingLogIdsRef.current);
+    }, 15000);
 
     return () => {
-      cancelled = true;
+      events.close();
       clearInterval(interval);
     };
-  }, [processingLogIds]);
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, []);
 
   // Selection helpers
   const toggleSelectLog = (id: number) => {
@@ -40,7 +40,8 @@ run_backend() {
 run_celery() {
   echo "Starting Celery worker..."
   cd "$ROOT_DIR/backend"
-  uv run celery -A backend worker --loglevel=info
+  # A single local worker consumes both the default and the 'io' queue
+  uv run celery -A backend worker --loglevel=info -Q celery,io
 }
 
 # Run based on argument